@@ -9,7 +9,7 @@ import warnings
 import numpy as np
 from scipy.constants import c
 from fbpic.utils.mpi import comm, mpi_type_dict, \
-    mpi_installed, gpudirect_enabled
+    mpi_installed, gpudirect_enabled, nccl_enabled
 from fbpic.fields.fields import InterpolationGrid
 from fbpic.fields.utility_methods import get_stencil_reach
 from fbpic.particles.particles import Particles
@@ -21,7 +21,7 @@ from .particle_buffer_handling import remove_outside_particles, \
 from fbpic.utils.cuda import cuda_installed
 if cuda_installed:
     import cupy
-    from fbpic.utils.cuda import cuda, cuda_tpb_bpg_2d
+    from fbpic.utils.cuda import cuda, cuda_tpb_bpg_2d, get_nccl_communicator
     from .cuda_methods import cuda_damp_EB_left, cuda_damp_EB_right, \
                                 cuda_damp_EB_left_pml, cuda_damp_EB_right_pml
 
@@ -203,6 +203,9 @@ class BoundaryCommunicator(object):
             self.mpi_comm = None
             self.rank = 0
             self.size = 1
+        # NCCL communicator (created when the fields are first exchanged
+        # on the GPU, if NCCL is enabled)
+        self.nccl_comm = None
         # Get the rank of the left and the right domain
         self.left_proc = self.rank-1
         self.right_proc = self.rank+1
@@ -594,7 +597,8 @@ class BoundaryCommunicator(object):
 
         fldtype: str
             An identifier for the field to send
-            (Either 'E', 'B', 'J' or 'rho')
+            (Either 'EB', 'E', 'B', 'J' or 'rho' ; 'EB' exchanges
+            E and B together, with a single message per neighbor)
 
         method: str
             Can either be 'replace' or 'add' depending on the type
@@ -605,35 +609,25 @@ class BoundaryCommunicator(object):
             return
 
         # Build the string `exchange_type`:
-        # This is either 'E:replace', 'B:replace', 'J:add', or 'rho:add'
+        # This is either 'EB:replace', 'E:replace', 'B:replace',
+        # 'J:add', or 'rho:add'
         exchange_type = ':'.join([ fldtype, method ])
-
-        # Shortcut
-        Nm = self.Nm
+        # Get the fields that are packed into the buffers of `exchange_type`
+        # (For 'EB', E and B are packed into the two halves of the same
+        # buffer, so that they are exchanged with one message per neighbor)
+        if fldtype == 'EB':
+            packed_fldtypes = ['E', 'B']
+        else:
+            packed_fldtypes = [ fldtype ]
         use_cuda = interp[0].use_cuda
+        use_nccl = (nccl_enabled and use_cuda)
+        if use_nccl and (self.nccl_comm is None):
+            self.nccl_comm = get_nccl_communicator( self.mpi_comm )
 
         # Fill the sending buffers with data from the interpolation grid
-        if fldtype in ('E', 'B', 'J'):
-            # Vector field
-            grid_r = [ getattr(interp[m], fldtype+'r') for m in range(Nm) ]
-            grid_t = [ getattr(interp[m], fldtype+'t') for m in range(Nm) ]
-            grid_z = [ getattr(interp[m], fldtype+'z') for m in range(Nm) ]
-            # Handle PML fields
-            if fldtype in ('E', 'B') and self.use_pml:
-                pml_r = [getattr(interp[m], fldtype+'r_pml') for m in range(Nm)]
-                pml_t = [getattr(interp[m], fldtype+'t_pml') for m in range(Nm)]
-            else:
-                pml_r = None
-                pml_t = None
-            self.mpi_buffers.handle_vec_buffer( grid_r, grid_t, grid_z,
-                    pml_r, pml_t, method, exchange_type, use_cuda,
-                    before_sending=True, gpudirect=gpudirect_enabled )
-        else:
-            # Scalar field
-            grid = [ getattr(interp[m], fldtype) for m in range(Nm) ]
-            self.mpi_buffers.handle_scal_buffer(
-                    grid, method, exchange_type, use_cuda,
-                    before_sending=True, gpudirect=gpudirect_enabled )
+        for packed_fldtype in packed_fldtypes:
+            self.handle_field_buffers( interp, packed_fldtype, method,
+                                        use_cuda, before_sending=True )
         if gpudirect_enabled:
             # Synchronize GPU execution (break asynchroneous kernel
             # execution to make sure that writing the buffer arrays
@@ -641,7 +635,7 @@ class BoundaryCommunicator(object):
             cuda.synchronize()
 
         # Prepare MPI call by pointing to the correct sending/receiving buffers
-        if gpudirect_enabled:
+        if gpudirect_enabled or use_nccl:
             # Create create pointers to GPU array, for cuda-aware MPI
             send_l = self.mpi_buffers.d_send_l[exchange_type] 
             send_r = self.mpi_buffers.d_send_r[exchange_type]
@@ -654,21 +648,77 @@ class BoundaryCommunicator(object):
             recv_l = self.mpi_buffers.recv_l[ exchange_type ]
             recv_r = self.mpi_buffers.recv_r[ exchange_type ]
 
-        # Send and receive the buffers via MPI
-        self.exchange_domains( send_l, send_r, recv_l, recv_r )
+        # Send and receive the buffers via MPI (or NCCL)
+        if use_nccl:
+            self.exchange_domains_nccl( send_l, send_r, recv_l, recv_r )
+        else:
+            self.exchange_domains( send_l, send_r, recv_l, recv_r )
 
         # Copy/Add the received buffers to the interpolation grid
+        for packed_fldtype in packed_fldtypes:
+            self.handle_field_buffers( interp, packed_fldtype, method,
+                                        use_cuda, after_receiving=True )
+
+
+    def handle_field_buffers( self, interp, fldtype, method, use_cuda,
+                              before_sending=False, after_receiving=False ):
+        """
+        Copy the fields of type `fldtype` to the sending buffers, or
+        copy/add the receiving buffers to these fields.
+
+        Parameters
+        ----------
+        interp: list
+            A list of InterpolationGrid objects
+            (one element per azimuthal mode)
+
+        fldtype: str
+            An identifier for the field to handle
+            (Either 'E', 'B', 'J' or 'rho')
+
+        method: str
+            Can either be 'replace' or 'add' depending on the type
+            of field exchange that is needed
+
+        use_cuda: bool
+            Whether the fields are on the GPU
+
+        before_sending, after_receiving: bool
+            Whether to fill the sending buffers, or to use
+            the receiving buffers
+        """
+        # Shortcut
+        Nm = self.Nm
+        exchange_type = ':'.join([ fldtype, method ])
+        # Whether the GPU buffers are exchanged directly (without
+        # copying them to the CPU)
+        gpudirect = gpudirect_enabled or (nccl_enabled and use_cuda)
+
         if fldtype in ('E', 'B', 'J'):
             # Vector field
-            self.mpi_buffers.handle_vec_buffer(
-                    grid_r, grid_t, grid_z, pml_r, pml_t,
-                    method, exchange_type, use_cuda,
-                    after_receiving=True, gpudirect=gpudirect_enabled )
+            grid_r = [ getattr(interp[m], fldtype+'r') for m in range(Nm) ]
+            grid_t = [ getattr(interp[m], fldtype+'t') for m in range(Nm) ]
+            grid_z = [ getattr(interp[m], fldtype+'z') for m in range(Nm) ]
+            # Handle PML fields
+            if fldtype in ('E', 'B') and self.use_pml:
+                pml_r = [getattr(interp[m], fldtype+'r_pml') for m in range(Nm)]
+                pml_t = [getattr(interp[m], fldtype+'t_pml') for m in range(Nm)]
+            else:
+                pml_r = None
+                pml_t = None
+            self.mpi_buffers.handle_vec_buffer( grid_r, grid_t, grid_z,
+                    pml_r, pml_t, method, exchange_type, use_cuda,
+                    before_sending=before_sending,
+                    after_receiving=after_receiving,
+                    gpudirect=gpudirect )
         else:
             # Scalar field
+            grid = [ getattr(interp[m], fldtype) for m in range(Nm) ]
             self.mpi_buffers.handle_scal_buffer(
                     grid, method, exchange_type, use_cuda,
-                    after_receiving=True, gpudirect=gpudirect_enabled )
+                    before_sending=before_sending,
+                    after_receiving=after_receiving,
+                    gpudirect=gpudirect )
 
 
     def exchange_domains( self, send_left, send_right, recv_left, recv_right ):
@@ -707,6 +757,47 @@ class BoundaryCommunicator(object):
             req_sr.Wait()
 
 
+    def exchange_domains_nccl( self, send_left, send_right,
+                                recv_left, recv_right ):
+        """
+        Send the GPU arrays send_left and send_right to the left and right
+        processes respectively.
+        Receive the arrays from the neighboring processes into recv_left
+        and recv_right.
+        Sending and receiving is done from GPU to GPU, with NCCL.
+
+        The communication is issued on the current CUDA stream, i.e. in
+        order with the kernels that fill and use the buffers, and thus
+        does not require any synchronization of the CPU with the GPU.
+
+        Parameters :
+        ------------
+        - send_left, send_right, recv_left, recv_right : cupy arrays
+             Sending and receiving buffers
+        """
+        from cupy.cuda import nccl
+        stream = cupy.cuda.get_current_stream().ptr
+        # The buffers are exchanged as raw bytes
+        # (NCCL does not have complex data types)
+        # NCCL has no tags: the messages between two given processes are
+        # matched in order. The sends are thus issued left-then-right and
+        # the receives right-then-left, so that the messages are matched
+        # correctly even when the left and right processes are the same
+        # (periodic boundaries with 2 processes).
+        nccl.groupStart()
+        if self.left_proc is not None :
+            self.nccl_comm.send( send_left.data.ptr, send_left.nbytes,
+                                 nccl.NCCL_UINT8, self.left_proc, stream )
+        if self.right_proc is not None :
+            self.nccl_comm.send( send_right.data.ptr, send_right.nbytes,
+                                 nccl.NCCL_UINT8, self.right_proc, stream )
+            self.nccl_comm.recv( recv_right.data.ptr, recv_right.nbytes,
+                                 nccl.NCCL_UINT8, self.right_proc, stream )
+        if self.left_proc is not None :
+            self.nccl_comm.recv( recv_left.data.ptr, recv_left.nbytes,
+                                 nccl.NCCL_UINT8, self.left_proc, stream )
+        nccl.groupEnd()
+
     def exchange_particles(self, species, fld, time ):
         """
         Look for particles that are located outside of the physical boundaries
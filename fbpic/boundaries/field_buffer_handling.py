@@ -78,38 +78,111 @@ class BufferHandler(object):
             # Use regular numpy arrays
             alloc_cpu = np.empty
         # Allocate buffers of different size, for the different exchange types
-        self.send_l = {
-            'E:replace': alloc_cpu( (n_fld*Nm,   ng, Nr), dtype=np.complex128),
-            'B:replace': alloc_cpu( (n_fld*Nm,   ng, Nr), dtype=np.complex128),
-            'J:add'    : alloc_cpu( (    3*Nm, 2*ng, Nr), dtype=np.complex128),
-            'rho:add'  : alloc_cpu( (      Nm, 2*ng, Nr), dtype=np.complex128)}
-        self.send_r = {
-            'E:replace': alloc_cpu( (n_fld*Nm,   ng, Nr), dtype=np.complex128),
-            'B:replace': alloc_cpu( (n_fld*Nm,   ng, Nr), dtype=np.complex128),
-            'J:add'    : alloc_cpu( (    3*Nm, 2*ng, Nr), dtype=np.complex128),
-            'rho:add'  : alloc_cpu( (      Nm, 2*ng, Nr), dtype=np.complex128)}
-        self.recv_l = {
-            'E:replace': alloc_cpu( (n_fld*Nm,   ng, Nr), dtype=np.complex128),
-            'B:replace': alloc_cpu( (n_fld*Nm,   ng, Nr), dtype=np.complex128),
-            'J:add'    : alloc_cpu( (    3*Nm, 2*ng, Nr), dtype=np.complex128),
-            'rho:add'  : alloc_cpu( (      Nm, 2*ng, Nr), dtype=np.complex128)}
-        self.recv_r = {
-            'E:replace': alloc_cpu( (n_fld*Nm,   ng, Nr), dtype=np.complex128),
-            'B:replace': alloc_cpu( (n_fld*Nm,   ng, Nr), dtype=np.complex128),
-            'J:add'    : alloc_cpu( (    3*Nm, 2*ng, Nr), dtype=np.complex128),
-            'rho:add'  : alloc_cpu( (      Nm, 2*ng, Nr), dtype=np.complex128)}
+        self.send_l = self.allocate_buffers( alloc_cpu, n_fld, ng, Nr, Nm )
+        self.send_r = self.allocate_buffers( alloc_cpu, n_fld, ng, Nr, Nm )
+        self.recv_l = self.allocate_buffers( alloc_cpu, n_fld, ng, Nr, Nm )
+        self.recv_r = self.allocate_buffers( alloc_cpu, n_fld, ng, Nr, Nm )
 
         # Allocate buffers on the GPU, for the different exchange types
         if cuda_installed:
-            self.d_send_l = { key: cupy.asarray(value) for key, value in \
-                                self.send_l.items() }
-            self.d_send_r = { key: cupy.asarray(value) for key, value in \
-                                self.send_r.items() }
-            self.d_recv_l = { key: cupy.asarray(value) for key, value in \
-                                self.recv_l.items() }
-            self.d_recv_r = { key: cupy.asarray(value) for key, value in \
-                                self.recv_r.items() }
+            self.d_send_l = self.allocate_buffers(
+                                cupy.empty, n_fld, ng, Nr, Nm )
+            self.d_send_r = self.allocate_buffers(
+                                cupy.empty, n_fld, ng, Nr, Nm )
+            self.d_recv_l = self.allocate_buffers(
+                                cupy.empty, n_fld, ng, Nr, Nm )
+            self.d_recv_r = self.allocate_buffers(
+                                cupy.empty, n_fld, ng, Nr, Nm )
+
+    def allocate_buffers( self, alloc, n_fld, ng, Nr, Nm ):
+        """
+        Allocate the buffers for the different exchange types,
+        for one side of the domain (either sending or receiving)
+
+        The buffers 'E:replace' and 'B:replace' are the two halves of
+        the buffer 'EB:replace', so that E and B can be packed separately
+        and then exchanged together, with a single message per neighbor.
+
+        Parameters
+        ----------
+        alloc: callable
+            The function used to allocate the arrays
+            (e.g. np.empty, cuda.pinned_array or cupy.empty)
+
+        n_fld: int
+            Number of field components exchanged for E and for B
+
+        ng, Nr, Nm: int
+            Number of guard cells, of radial cells and of azimuthal modes
+
+        Returns
+        -------
+        A dictionary of arrays, with one element per exchange type
+        """
+        EB = alloc( (2*n_fld*Nm, ng, Nr), dtype=np.complex128 )
+        return {
+            'EB:replace': EB,
+            'E:replace' : EB[:n_fld*Nm],
+            'B:replace' : EB[n_fld*Nm:],
+            'J:add'     : alloc( (3*Nm, 2*ng, Nr), dtype=np.complex128 ),
+            'rho:add'   : alloc( (  Nm, 2*ng, Nr), dtype=np.complex128 ) }
+
+    def copy_send_buffers_to_cpu( self, exchange_type,
+                                  copy_left, copy_right ):
+        """
+        Copy the GPU sending buffers of `exchange_type` to the
+        corresponding (pagelocked) CPU buffers.
+
+        The copies are issued asynchronously on the current stream, so that
+        the left and right copies do not each block the CPU ; a single
+        synchronization then ensures that the CPU buffers are complete
+        before they are sent via MPI.
+
+        Parameters
+        ----------
+        exchange_type: str
+            Can either be 'E:replace', 'B:replace', 'J:add' or 'rho:add'
+
+        copy_left, copy_right: bool
+            Whether to copy the buffers for the left and right neighbor
+        """
+        stream = cupy.cuda.get_current_stream()
+        if copy_left:
+            self.d_send_l[exchange_type].get(
+                out=self.send_l[exchange_type], stream=stream )
+        if copy_right:
+            self.d_send_r[exchange_type].get(
+                out=self.send_r[exchange_type], stream=stream )
+        stream.synchronize()
+
+    def copy_recv_buffers_to_gpu( self, exchange_type,
+                                  copy_left, copy_right ):
+        """
+        Copy the (pagelocked) CPU receiving buffers of `exchange_type`
+        to the corresponding GPU buffers.
+
+        The copies are issued asynchronously on the current stream: the
+        kernels that later read the GPU buffers are launched on the same
+        stream, and are thus automatically ordered after the copies.
+        (The CPU buffers are only overwritten by the next MPI exchange,
+        which is preceded by `copy_send_buffers_to_cpu` and its
+        synchronization.)
 
+        Parameters
+        ----------
+        exchange_type: str
+            Can either be 'E:replace', 'B:replace', 'J:add' or 'rho:add'
+
+        copy_left, copy_right: bool
+            Whether to copy the buffers from the left and right neighbor
+        """
+        stream = cupy.cuda.get_current_stream()
+        if copy_left:
+            self.d_recv_l[exchange_type].set(
+                self.recv_l[exchange_type], stream=stream )
+        if copy_right:
+            self.d_recv_r[exchange_type].set(
+                self.recv_r[exchange_type], stream=stream )
 
     def handle_vec_buffer(self, grid_r, grid_t, grid_z,
                             pml_r, pml_t, method, exchange_type,
@@ -216,23 +289,15 @@ class BufferHandler(object):
                 # If GPUDirect with CUDA-aware MPI is not used,
                 # copy the GPU buffers to the sending CPU buffers
                 if not gpudirect:
-                    if copy_left:
-                        self.d_send_l[exchange_type].get(
-                            out=self.send_l[exchange_type] )
-                    if copy_right:
-                        self.d_send_r[exchange_type].get(
-                            out=self.send_r[exchange_type] )
+                    self.copy_send_buffers_to_cpu( exchange_type,
+                                                copy_left, copy_right )
 
             elif after_receiving:
                 # If GPUDirect with CUDA-aware MPI is not used,
                 # copy the CPU receiving buffers to the GPU buffers
                 if not gpudirect:
-                    if copy_left:
-                        self.d_recv_l[exchange_type].set(
-                            self.recv_l[exchange_type] )
-                    if copy_right:
-                        self.d_recv_r[exchange_type].set(
-                            self.recv_r[exchange_type] )
+                    self.copy_recv_buffers_to_gpu( exchange_type,
+                                                copy_left, copy_right )
                 if method == 'replace':
                     # Replace the guard cells of the domain with the buffers
                     for m in range(self.Nm):
@@ -432,23 +497,15 @@ class BufferHandler(object):
                 # If GPUDirect with CUDA-aware MPI is not used,
                 # copy the GPU buffers to the sending CPU buffers
                 if not gpudirect:
-                    if copy_left:
-                        self.d_send_l[exchange_type].get(
-                            out=self.send_l[exchange_type] )
-                    if copy_right:
-                        self.d_send_r[exchange_type].get(
-                            out=self.send_r[exchange_type] )
+                    self.copy_send_buffers_to_cpu( exchange_type,
+                                                copy_left, copy_right )
 
             elif after_receiving:
                 # If GPUDirect with CUDA-aware MPI is not used,
                 # copy the CPU receiving buffers to the GPU buffers
                 if not gpudirect:
-                    if copy_left:
-                        self.d_recv_l[exchange_type].set(
-                            self.recv_l[exchange_type] )
-                    if copy_right:
-                        self.d_recv_r[exchange_type].set(
-                            self.recv_r[exchange_type] )
+                    self.copy_recv_buffers_to_gpu( exchange_type,
+                                                copy_left, copy_right )
                 if method == 'replace':
                     # Replace the guard cells of the domain with the buffers
                     for m in range(self.Nm):
@@ -350,13 +350,12 @@ def add_buffers_to_particles( species, float_recv_left, float_recv_right,
     if species.use_cuda:
         shape = (species.Ntot,)
         # Reallocate empty field-on-particle arrays on the GPU
-        species.Ex = cupy.empty( shape, dtype=np.float64 )
-        species.Ex = cupy.empty( shape, dtype=np.float64 )
-        species.Ey = cupy.empty( shape, dtype=np.float64 )
-        species.Ez = cupy.empty( shape, dtype=np.float64 )
-        species.Bx = cupy.empty( shape, dtype=np.float64 )
-        species.By = cupy.empty( shape, dtype=np.float64 )
-        species.Bz = cupy.empty( shape, dtype=np.float64 )
+        species.Ex = cupy.empty( shape, dtype=species.field_dtype )
+        species.Ey = cupy.empty( shape, dtype=species.field_dtype )
+        species.Ez = cupy.empty( shape, dtype=species.field_dtype )
+        species.Bx = cupy.empty( shape, dtype=species.field_dtype )
+        species.By = cupy.empty( shape, dtype=species.field_dtype )
+        species.Bz = cupy.empty( shape, dtype=species.field_dtype )
         # Reallocate empty auxiliary sorting arrays on the GPU
         species.cell_idx = cupy.empty( shape, dtype=np.int32 )
         species.sorted_idx = cupy.empty( shape, dtype=np.intp )
@@ -364,14 +363,17 @@ def add_buffers_to_particles( species, float_recv_left, float_recv_right,
         if species.n_integer_quantities > 0:
             species.int_sorting_buffer = \
                 cupy.empty( shape, dtype=np.uint64 )
+        if hasattr( species, 'field_sorting_buffer' ):
+            species.field_sorting_buffer = \
+                cupy.empty( shape, dtype=species.field_dtype )
     else:
         # Reallocate empty field-on-particle arrays on the CPU
-        species.Ex = np.empty(species.Ntot, dtype=np.float64)
-        species.Ey = np.empty(species.Ntot, dtype=np.float64)
-        species.Ez = np.empty(species.Ntot, dtype=np.float64)
-        species.Bx = np.empty(species.Ntot, dtype=np.float64)
-        species.By = np.empty(species.Ntot, dtype=np.float64)
-        species.Bz = np.empty(species.Ntot, dtype=np.float64)
+        species.Ex = np.empty(species.Ntot, dtype=species.field_dtype)
+        species.Ey = np.empty(species.Ntot, dtype=species.field_dtype)
+        species.Ez = np.empty(species.Ntot, dtype=species.field_dtype)
+        species.Bx = np.empty(species.Ntot, dtype=species.field_dtype)
+        species.By = np.empty(species.Ntot, dtype=species.field_dtype)
+        species.Bz = np.empty(species.Ntot, dtype=species.field_dtype)
 
     # The particles are unsorted after adding new particles.
     species.sorted = False
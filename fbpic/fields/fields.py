@@ -218,30 +218,40 @@ class Fields(object) :
                     shape=(nthreads, self.Nm, self.Nz+4, self.Nr+4) )
 
 
-    def send_fields_to_gpu( self ):
+    def send_fields_to_gpu( self, stream=None ):
         """
         Copy the fields to the GPU.
 
         After this function is called, the array attributes of the
         interpolation and spectral grids point to GPU arrays
+
+        Parameters
+        ----------
+        stream: cupy.cuda.Stream, optional
+            The stream on which the copies are issued (asynchronously)
         """
         if self.use_cuda:
             for m in range(self.Nm) :
-                self.interp[m].send_fields_to_gpu()
-                self.spect[m].send_fields_to_gpu()
+                self.interp[m].send_fields_to_gpu( stream=stream )
+                self.spect[m].send_fields_to_gpu( stream=stream )
             self.data_is_on_gpu = True
 
-    def receive_fields_from_gpu( self ):
+    def receive_fields_from_gpu( self, stream=None ):
         """
         Receive the fields from the GPU.
 
         After this function is called, the array attributes of the
         interpolation and spectral grids are accessible by the CPU again.
+
+        Parameters
+        ----------
+        stream: cupy.cuda.Stream, optional
+            The stream on which the copies are issued (asynchronously)
         """
         if self.use_cuda:
             for m in range(self.Nm) :
-                self.interp[m].receive_fields_from_gpu()
-                self.spect[m].receive_fields_from_gpu()
+                self.interp[m].receive_fields_from_gpu( stream=stream )
+                self.spect[m].receive_fields_from_gpu( stream=stream )
             self.data_is_on_gpu = False
 
     def push(self, use_true_rho=False, check_exchanges=False):
@@ -310,7 +320,7 @@ class Fields(object) :
         for m in range(self.Nm) :
             self.spect[m].correct_divE()
 
-    def interp2spect(self, fieldtype) :
+    def interp2spect(self, fieldtype, filtered=False) :
         """
         Transform the fields `fieldtype` from the interpolation
         grid to the spectral grid
@@ -319,10 +329,34 @@ class Fields(object) :
         ---------
         fieldtype :
             A string which represents the kind of field to transform
-            (either 'E', 'B', 'E_pml', 'B_pml', 'J', 'rho_next', 'rho_prev')
+            (either 'E', 'B', 'EB', 'E_pml', 'B_pml', 'J', 'rho_next',
+            'rho_prev')
+
+        filtered : bool, optional
+            Whether to also apply the spectral filter (equivalent to calling
+            `filter_spect` afterwards, but without an additional pass over
+            the spectral arrays). Only supported for 'J' and rho.
         """
+        if filtered and not (fieldtype == 'J' or fieldtype.startswith('rho')):
+            raise ValueError('Filtering is not supported for %s' %fieldtype)
+
         # Use the appropriate transformation depending on the fieldtype.
-        if fieldtype == 'E' :
+        if fieldtype == 'EB' :
+            # Transform each azimuthal grid individually
+            # (E and B are transformed within the same loop, so that the
+            # transformer of each mode is reused while it is in cache)
+            for m in range(self.Nm) :
+                self.trans[m].interp2spect_scal(
+                    self.interp[m].Ez, self.spect[m].Ez )
+                self.trans[m].interp2spect_vect(
+                    self.interp[m].Er, self.interp[m].Et,
+                    self.spect[m].Ep, self.spect[m].Em )
+                self.trans[m].interp2spect_scal(
+                    self.interp[m].Bz, self.spect[m].Bz )
+                self.trans[m].interp2spect_vect(
+                    self.interp[m].Br, self.interp[m].Bt,
+                    self.spect[m].Bp, self.spect[m].Bm )
+        elif fieldtype == 'E' :
             # Transform each azimuthal grid individually
             for m in range(self.Nm) :
                 self.trans[m].interp2spect_scal(
@@ -353,17 +387,19 @@ class Fields(object) :
         elif fieldtype == 'J' :
             # Transform each azimuthal grid individually
             for m in range(self.Nm) :
+                filter_arrays = self.spect[m].get_filter_arrays(filtered)
                 self.trans[m].interp2spect_scal(
-                    self.interp[m].Jz, self.spect[m].Jz )
+                    self.interp[m].Jz, self.spect[m].Jz, filter_arrays )
                 self.trans[m].interp2spect_vect(
                     self.interp[m].Jr, self.interp[m].Jt,
-                    self.spect[m].Jp, self.spect[m].Jm )
+                    self.spect[m].Jp, self.spect[m].Jm, filter_arrays )
         elif fieldtype in ['rho_prev', 'rho_next', 'rho_next_z', 'rho_next_xy']:
             # Transform each azimuthal grid individually
             for m in range(self.Nm) :
+                filter_arrays = self.spect[m].get_filter_arrays(filtered)
                 spectral_rho = getattr( self.spect[m], fieldtype )
                 self.trans[m].interp2spect_scal(
-                    self.interp[m].rho, spectral_rho )
+                    self.interp[m].rho, spectral_rho, filter_arrays )
         else:
             raise ValueError( 'Invalid string for fieldtype: %s' %fieldtype )
 
@@ -376,10 +412,26 @@ class Fields(object) :
         ---------
         fieldtype :
             A string which represents the kind of field to transform
-            (either 'E', 'B', 'E_pml', 'B_pml', 'J', 'rho_next', 'rho_prev')
+            (either 'E', 'B', 'EB', 'E_pml', 'B_pml', 'J', 'rho_next',
+            'rho_prev')
         """
         # Use the appropriate transformation depending on the fieldtype.
-        if fieldtype == 'E' :
+        if fieldtype == 'EB' :
+            # Transform each azimuthal grid individually
+            # (E and B are transformed within the same loop, so that the
+            # transformer of each mode is reused while it is in cache)
+            for m in range(self.Nm) :
+                self.trans[m].spect2interp_scal(
+                    self.spect[m].Ez, self.interp[m].Ez )
+                self.trans[m].spect2interp_vect(
+                    self.spect[m].Ep,  self.spect[m].Em,
+                    self.interp[m].Er, self.interp[m].Et )
+                self.trans[m].spect2interp_scal(
+                    self.spect[m].Bz, self.interp[m].Bz )
+                self.trans[m].spect2interp_vect(
+                    self.spect[m].Bp, self.spect[m].Bm,
+                    self.interp[m].Br, self.interp[m].Bt )
+        elif fieldtype == 'E' :
             # Transform each azimuthal grid individually
             for m in range(self.Nm) :
                 self.trans[m].spect2interp_scal(
@@ -8,11 +8,14 @@ It defines the InterpolationGrid class.
 import numpy as np
 from fbpic.fields.spectral_transform.hankel import DHT
 from scipy.special import j1, jn_zeros
+from .numba_methods import numba_divide_scalar_by_volume, \
+                            numba_divide_vector_by_volume
 # Check if CUDA is available, then import CUDA functions
 from fbpic.utils.cuda import cuda_installed
 if cuda_installed:
     import cupy
-    from fbpic.utils.cuda import cuda_tpb_bpg_2d
+    from fbpic.utils.cuda import cuda_tpb_bpg_2d, \
+        send_array_to_gpu, receive_array_from_gpu
     from .cuda_methods import \
         cuda_erase_scalar, cuda_erase_vector, \
         cuda_divide_scalar_by_volume, cuda_divide_vector_by_volume
@@ -157,6 +160,8 @@ class InterpolationGrid(object) :
 
         # Check whether the GPU should be used
         self.use_cuda = use_cuda
+        # Pagelocked CPU buffers, used when sending/receiving to the GPU
+        self.host_buffers = {}
 
         # Replace the invvol array as well as the Ruyten coefficients by an array
         # on the GPU, when using cuda
@@ -175,51 +180,49 @@ class InterpolationGrid(object) :
         """Returns the 1d array of r, when the user queries self.r"""
         return( self.rmin + (0.5+np.arange(self.Nr))*self.dr )
 
-    def send_fields_to_gpu( self ):
+    def get_fieldnames( self ):
+        """
+        Return the list of the names of the field arrays that
+        are sent to / received from the GPU
+        """
+        fieldnames = ['Er', 'Et', 'Ez', 'Br', 'Bt', 'Bz', 'Jr', 'Jt', 'Jz', 'rho']
+        if self.use_pml:
+            fieldnames += ['Er_pml', 'Et_pml', 'Br_pml', 'Bt_pml']
+        return( fieldnames )
+
+    def send_fields_to_gpu( self, stream=None ):
         """
         Copy the fields to the GPU.
 
         After this function is called, the array attributes
         point to GPU arrays.
+        Parameters
+        ----------
+        stream: cupy.cuda.Stream, optional
+            The stream on which the copies are issued (asynchronously)
         """
-        self.Er = cupy.asarray( self.Er )
-        self.Et = cupy.asarray( self.Et )
-        self.Ez = cupy.asarray( self.Ez )
-        self.Br = cupy.asarray( self.Br )
-        self.Bt = cupy.asarray( self.Bt )
-        self.Bz = cupy.asarray( self.Bz )
-        self.Jr = cupy.asarray( self.Jr )
-        self.Jt = cupy.asarray( self.Jt )
-        self.Jz = cupy.asarray( self.Jz )
-        self.rho = cupy.asarray( self.rho )
-        if self.use_pml:
-            self.Er_pml = cupy.asarray( self.Er_pml )
-            self.Et_pml = cupy.asarray( self.Et_pml )
-            self.Br_pml = cupy.asarray( self.Br_pml )
-            self.Bt_pml = cupy.asarray( self.Bt_pml )
+        for fieldname in self.get_fieldnames():
+            setattr( self, fieldname, send_array_to_gpu(
+                getattr( self, fieldname ), self.host_buffers, fieldname,
+                stream=stream ) )
 
-    def receive_fields_from_gpu( self ):
+    def receive_fields_from_gpu( self, stream=None ):
         """
         Receive the fields from the GPU.
 
         After this function is called, the array attributes
-        are accessible by the CPU again.
+        are accessible by the CPU again. (These CPU arrays are
+        pagelocked buffers that are updated in place by later
+        transfers from the GPU.)
+        Parameters
+        ----------
+        stream: cupy.cuda.Stream, optional
+            The stream on which the copies are issued (asynchronously)
         """
-        self.Er = self.Er.get()
-        self.Et = self.Et.get()
-        self.Ez = self.Ez.get()
-        self.Br = self.Br.get()
-        self.Bt = self.Bt.get()
-        self.Bz = self.Bz.get()
-        self.Jr = self.Jr.get()
-        self.Jt = self.Jt.get()
-        self.Jz = self.Jz.get()
-        self.rho = self.rho.get()
-        if self.use_pml:
-            self.Er_pml = self.Er_pml.get()
-            self.Et_pml = self.Et_pml.get()
-            self.Br_pml = self.Br_pml.get()
-            self.Bt_pml = self.Bt_pml.get()
+        for fieldname in self.get_fieldnames():
+            setattr( self, fieldname, receive_array_from_gpu(
+                getattr( self, fieldname ), self.host_buffers, fieldname,
+                stream=stream ) )
 
     def erase( self, fieldtype ):
         """
@@ -297,10 +300,9 @@ class InterpolationGrid(object) :
         else :
             # Perform division on the CPU
             if fieldtype == 'rho':
-                self.rho *= self.invvol[np.newaxis,:]
+                numba_divide_scalar_by_volume( self.rho, self.invvol )
             elif fieldtype == 'J':
-                self.Jr *= self.invvol[np.newaxis,:]
-                self.Jt *= self.invvol[np.newaxis,:]
-                self.Jz *= self.invvol[np.newaxis,:]
+                numba_divide_vector_by_volume(
+                        self.Jr, self.Jt, self.Jz, self.invvol )
             else:
                 raise ValueError('Invalid string for fieldtype: %s'%fieldtype)
@@ -382,6 +382,54 @@ def numba_push_eb_pml_comoving( Ep_pml, Em_pml, Bp_pml, Bm_pml,
     return
 
 
+# ---------------------------
+# Divide by volume functions
+# ---------------------------
+
+@njit_parallel
+def numba_divide_scalar_by_volume( array, invvol ):
+    """
+    Multiply the input array by the corresponding invvol
+
+    Parameters:
+    ------------
+    array: 2darray of complexs
+       Array that represent the fields on the grid
+       (The first axis corresponds to z and the second axis to r)
+
+    invvol: 1darray of floats
+       Array that contain the inverse of the volume of the cell
+       The axis corresponds to r
+    """
+    Nz, Nr = array.shape
+    # Loop over the 2D grid (parallel in z, if threading is installed)
+    for iz in prange(Nz):
+        for ir in range(Nr):
+            array[iz, ir] = array[iz, ir] * invvol[ir]
+
+@njit_parallel
+def numba_divide_vector_by_volume( array_r, array_t, array_z, invvol ):
+    """
+    Multiply the input arrays by the corresponding invvol
+
+    Parameters:
+    ------------
+    array_r, array_t, array_z: 2darrays of complexs
+       Arrays that represent the fields on the grid
+       (The first axis corresponds to z and the second axis to r)
+
+    invvol: 1darray of floats
+       Arrays that contain the inverse of the volume of the cell
+       The axis corresponds to r
+    """
+    Nz, Nr = array_r.shape
+    # Loop over the 2D grid (parallel in z, if threading is installed)
+    for iz in prange(Nz):
+        for ir in range(Nr):
+            array_r[iz, ir] = array_r[iz, ir] * invvol[ir]
+            array_t[iz, ir] = array_t[iz, ir] * invvol[ir]
+            array_z[iz, ir] = array_z[iz, ir] * invvol[ir]
+
 # -----------------------------------------------------------------------
 # Parallel reduction of the global arrays for threads into a single array
 # -----------------------------------------------------------------------
@@ -18,7 +18,8 @@ from .numba_methods import numba_push_eb_standard, numba_push_eb_comoving, \
 from fbpic.utils.cuda import cuda_installed
 if cuda_installed:
     import cupy
-    from fbpic.utils.cuda import cuda_tpb_bpg_2d
+    from fbpic.utils.cuda import cuda_tpb_bpg_2d, \
+        send_array_to_gpu, receive_array_from_gpu
     from .cuda_methods import \
     cuda_correct_currents_curlfree_standard, \
     cuda_correct_currents_crossdeposition_standard, \
@@ -125,6 +126,8 @@ class SpectralGrid(object) :
 
         # Check whether to use the GPU
         self.use_cuda = use_cuda
+        # Pagelocked CPU buffers, used when sending/receiving to the GPU
+        self.host_buffers = {}
 
         # Transfer the auxiliary arrays on the GPU
         if self.use_cuda :
@@ -137,62 +140,53 @@ class SpectralGrid(object) :
                 self.d_inv_k2 = cupy.asarray( self.inv_k2 )
 
 
-    def send_fields_to_gpu( self ):
+    def get_fieldnames( self ):
         """
-        Copy the fields to the GPU.
-
-        After this function is called, the array attributes
-        point to GPU arrays.
+        Return the list of the names of the field arrays that
+        are sent to / received from the GPU
         """
-        self.Ep = cupy.asarray( self.Ep )
-        self.Em = cupy.asarray( self.Em )
-        self.Ez = cupy.asarray( self.Ez )
-        self.Bp = cupy.asarray( self.Bp )
-        self.Bm = cupy.asarray( self.Bm )
-        self.Bz = cupy.asarray( self.Bz )
-        self.Jp = cupy.asarray( self.Jp )
-        self.Jm = cupy.asarray( self.Jm )
-        self.Jz = cupy.asarray( self.Jz )
-        self.rho_prev = cupy.asarray( self.rho_prev )
-        self.rho_next = cupy.asarray( self.rho_next )
+        fieldnames = ['Ep', 'Em', 'Ez', 'Bp', 'Bm', 'Bz', 'Jp', 'Jm', 'Jz',
+                        'rho_prev', 'rho_next']
         if self.use_pml:
-            self.Ep_pml = cupy.asarray( self.Ep_pml )
-            self.Em_pml = cupy.asarray( self.Em_pml )
-            self.Bp_pml = cupy.asarray( self.Bp_pml )
-            self.Bm_pml = cupy.asarray( self.Bm_pml )
+            fieldnames += ['Ep_pml', 'Em_pml', 'Bp_pml', 'Bm_pml']
         # Only when using the cross-deposition
         if hasattr( self, 'rho_next_z' ):
-            self.rho_next_z = cupy.asarray( self.rho_next_z )
-            self.rho_next_xy = cupy.asarray( self.rho_next_xy )
+            fieldnames += ['rho_next_z', 'rho_next_xy']
+        return( fieldnames )
+
+    def send_fields_to_gpu( self, stream=None ):
+        """
+        Copy the fields to the GPU.
 
+        After this function is called, the array attributes
+        point to GPU arrays.
+        Parameters
+        ----------
+        stream: cupy.cuda.Stream, optional
+            The stream on which the copies are issued (asynchronously)
+        """
+        for fieldname in self.get_fieldnames():
+            setattr( self, fieldname, send_array_to_gpu(
+                getattr( self, fieldname ), self.host_buffers, fieldname,
+                stream=stream ) )
 
-    def receive_fields_from_gpu( self ):
+    def receive_fields_from_gpu( self, stream=None ):
         """
         Receive the fields from the GPU.
 
         After this function is called, the array attributes
-        are accessible by the CPU again.
+        are accessible by the CPU again. (These CPU arrays are
+        pagelocked buffers that are updated in place by later
+        transfers from the GPU.)
+        Parameters
+        ----------
+        stream: cupy.cuda.Stream, optional
+            The stream on which the copies are issued (asynchronously)
         """
-        self.Ep = self.Ep.get()
-        self.Em = self.Em.get()
-        self.Ez = self.Ez.get()
-        self.Bp = self.Bp.get()
-        self.Bm = self.Bm.get()
-        self.Bz = self.Bz.get()
-        self.Jp = self.Jp.get()
-        self.Jm = self.Jm.get()
-        self.Jz = self.Jz.get()
-        if self.use_pml:
-            self.Ep_pml = self.Ep_pml.get()
-            self.Em_pml = self.Em_pml.get()
-            self.Bp_pml = self.Bp_pml.get()
-            self.Bm_pml = self.Bm_pml.get()
-        self.rho_prev = self.rho_prev.get()
-        self.rho_next = self.rho_next.get()
-        # Only when using the cross-deposition
-        if hasattr( self, 'rho_next_z' ):
-            self.rho_next_z = self.rho_next_z.get()
-            self.rho_next_xy = self.rho_next_xy.get()
+        for fieldname in self.get_fieldnames():
+            setattr( self, fieldname, receive_array_from_gpu(
+                getattr( self, fieldname ), self.host_buffers, fieldname,
+                stream=stream ) )
 
 
     def correct_currents (self, dt, ps, current_correction ):
@@ -420,6 +414,24 @@ class SpectralGrid(object) :
             self.rho_prev[:,:] = self.rho_next[:,:]
             self.rho_next[:,:] = 0.
 
+    def get_filter_arrays(self, filtered=True) :
+        """
+        Return the arrays (filter_array_z, filter_array_r) of the
+        spectral filter (on the GPU, when using cuda), or None
+        if `filtered` is False
+
+        Parameter
+        ---------
+        filtered : bool
+            Whether the filter is to be applied
+        """
+        if not filtered:
+            return( None )
+        elif self.use_cuda:
+            return( (self.d_filter_array_z, self.d_filter_array_r) )
+        else:
+            return( (self.filter_array_z, self.filter_array_r) )
+
     def filter(self, fieldtype) :
         """
         Filter the field `fieldtype`
@@ -60,6 +60,32 @@ def cuda_copy_2dR_to_2dC( array_in, array_out ) :
     if (iz < Nz) and (ir < Nr) :
         array_out[iz, ir] = array_in[iz, ir] + 1.j*array_in[iz+Nz, ir]
 
+@compile_cupy
+def cuda_copy_2dR_to_2dC_filtered( array_in, array_out,
+                                    filter_array_z, filter_array_r ) :
+    """
+    Reconstruct the complex Nz x Nr array `array_out`,
+    from the real 2Nz x Nr array `array_in` (as in `cuda_copy_2dR_to_2dC`),
+    and multiply it by the spectral filter at the same time.
+
+    Parameters :
+    ------------
+    array_in: 2darray of reals
+        Array of shape (2*Nz, Nr)
+    array_out: 2darray of complexs
+        Array of shape (Nz, Nr)
+    filter_array_z, filter_array_r : 1darray of reals
+        Arrays that damp the fields at high k, in z and r respectively
+    """
+    # Set up cuda grid
+    iz, ir = cuda.grid(2)
+    Nz, Nr = array_out.shape
+
+    # Copy from array_in to array_out, and apply the filter
+    if (iz < Nz) and (ir < Nr) :
+        array_out[iz, ir] = filter_array_z[iz]*filter_array_r[ir]*( \
+            array_in[iz, ir] + 1.j*array_in[iz+Nz, ir] )
+
 @compile_cupy
 def cuda_copy_2d_to_1d( array_2d, array_1d ) :
     """
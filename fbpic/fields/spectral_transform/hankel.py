@@ -1,7 +1,7 @@
 # Copyright 2016, FBPIC contributors
 # Authors: Remi Lehe, Manuel Kirchen
 # License: 3-Clause-BSD-LBNL
-"""
+r"""
 This file is part of FBPIC (Fourier-Bessel Particle-In-Cell code).
 It defines the class that performs the Hankel transform.
 
@@ -14,10 +14,12 @@ from scipy.special import jn, jn_zeros
 
 # Check if CUDA is available, then import CUDA functions
 from fbpic.utils.cuda import cuda_installed
-from .numba_methods import numba_copy_2dC_to_2dR, numba_copy_2dR_to_2dC
+from .numba_methods import numba_copy_2dC_to_2dR, numba_copy_2dR_to_2dC, \
+    numba_copy_2dR_to_2dC_filtered
 if cuda_installed:
-    from fbpic.utils.cuda import cuda_tpb_bpg_2d, cuda_gpu_model
-    from .cuda_methods import cuda_copy_2dC_to_2dR, cuda_copy_2dR_to_2dC
+    from fbpic.utils.cuda import cuda_tpb_bpg_2d, get_gpu_model
+    from .cuda_methods import cuda_copy_2dC_to_2dR, cuda_copy_2dR_to_2dC, \
+        cuda_copy_2dR_to_2dC_filtered
     import cupy
     from cupy.cuda import device, cublas
 
@@ -144,7 +146,7 @@ class DHT(object):
             self.blas = device.get_cublas_handle()
             # Set optimal number of CUDA threads per block
             # for copy 2d real/complex (determined empirically)
-            copy_tpb = (8,32) if cuda_gpu_model == "V100" else (2,16)
+            copy_tpb = (8,32) if get_gpu_model() == "V100" else (2,16)
             # Initialize the threads per block and block per grid
             self.dim_grid, self.dim_block = cuda_tpb_bpg_2d(Nz, Nr, *copy_tpb)
 
@@ -171,7 +173,7 @@ class DHT(object):
         return( self.nu )
 
 
-    def transform( self, F, G ):
+    def transform( self, F, G, filter_arrays=None ):
         """
         Perform the Hankel transform of F.
 
@@ -183,6 +185,11 @@ class DHT(object):
 
         G: 2darray of complex values
         Array where the result will be stored
+
+        filter_arrays: tuple of 1darrays of reals, optional
+        The arrays (filter_array_z, filter_array_r) of a spectral filter.
+        If provided, the filter is applied to the result as it is
+        written to G (instead of requiring a separate pass over G).
         """
         # Perform the matrix product with M
         if self.use_cuda:
@@ -194,14 +201,23 @@ class DHT(object):
                             self.d_in.data.ptr, self.Nr,
                          0, self.d_out.data.ptr, self.Nr)
             # Convert F-order, real `d_out` to the C-order, complex `G`
-            cuda_copy_2dR_to_2dC[self.dim_grid, self.dim_block]( self.d_out, G )
+            if filter_arrays is None:
+                cuda_copy_2dR_to_2dC[self.dim_grid, self.dim_block](
+                    self.d_out, G )
+            else:
+                cuda_copy_2dR_to_2dC_filtered[self.dim_grid, self.dim_block](
+                    self.d_out, G, filter_arrays[0], filter_arrays[1] )
         else:
             # Convert complex array `F` to real array `array_in`
             numba_copy_2dC_to_2dR( F, self.array_in )
             # Perform real matrix product (faster than complex matrix product)
             np.dot( self.array_in, self.M, out=self.array_out )
             # Convert real array `array_out` to complex array `G`
-            numba_copy_2dR_to_2dC( self.array_out, G )
+            if filter_arrays is None:
+                numba_copy_2dR_to_2dC( self.array_out, G )
+            else:
+                numba_copy_2dR_to_2dC_filtered( self.array_out, G,
+                                    filter_arrays[0], filter_arrays[1] )
 
 
     def inverse_transform( self, G, F ):
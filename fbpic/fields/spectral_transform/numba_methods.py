@@ -53,6 +53,31 @@ def numba_copy_2dR_to_2dC( array_in, array_out ) :
         for ir in range(Nr):
             array_out[iz, ir] = array_in[iz, ir] + 1.j*array_in[iz+Nz, ir]
 
+@njit_parallel
+def numba_copy_2dR_to_2dC_filtered( array_in, array_out,
+                                    filter_array_z, filter_array_r ) :
+    """
+    Reconstruct the complex Nz x Nr array `array_out`,
+    from the real 2Nz x Nr array `array_in` (as in `numba_copy_2dR_to_2dC`),
+    and multiply it by the spectral filter at the same time.
+
+    Parameters :
+    ------------
+    array_in: 2darray of reals
+        Array of shape (2*Nz, Nr)
+    array_out: 2darray of complexs
+        Array of shape (Nz, Nr)
+    filter_array_z, filter_array_r : 1darray of reals
+        Arrays that damp the fields at high k, in z and r respectively
+    """
+    Nz, Nr = array_out.shape
+
+    # Loop over the 2D grid (parallel in z, if threading is installed)
+    for iz in prange(Nz):
+        for ir in range(Nr):
+            array_out[iz, ir] = filter_array_z[iz]*filter_array_r[ir]*( \
+                array_in[iz, ir] + 1.j*array_in[iz+Nz, ir] )
+
 # ----------------------------------------------------
 # Functions that combine components in spectral space
 # ----------------------------------------------------
@@ -154,7 +154,8 @@ class SpectralTransformer(object) :
         self.fft.inverse_transform( self.spect_buffer_r, interp_array_r )
         self.fft.inverse_transform( self.spect_buffer_t, interp_array_t )
 
-    def interp2spect_scal( self, interp_array, spect_array ) :
+    def interp2spect_scal( self, interp_array, spect_array,
+                            filter_arrays=None ) :
         """
         Convert a scalar field from the interpolation grid
         to the spectral grid.
@@ -169,15 +170,20 @@ class SpectralTransformer(object) :
         spect_array : 2darray
            A complex array representing the fields in spectral space,
            and which is overwritten by this function.
+
+        filter_arrays : tuple of 1darrays, optional
+           The arrays (filter_array_z, filter_array_r) of a spectral
+           filter, which is then applied when writing `spect_array`.
         """
         # Perform the FFT first (along axis 0, which corresponds to z)
         self.fft.transform( interp_array, self.spect_buffer_r )
 
         # Then perform the DHT (along axis -1, which corresponds to r)
-        self.dht0.transform( self.spect_buffer_r, spect_array )
+        self.dht0.transform( self.spect_buffer_r, spect_array, filter_arrays )
 
     def interp2spect_vect( self, interp_array_r, interp_array_t,
-                           spect_array_p, spect_array_m ) :
+                           spect_array_p, spect_array_m,
+                           filter_arrays=None ) :
         """
         Convert a transverse vector field from the interpolation grid
         (e.g. Er, Et) to the spectral space (e.g. Ep, Em)
@@ -192,6 +198,10 @@ class SpectralTransformer(object) :
         spect_array_p, spect_array_m : 2darray
            Complex arrays representing the fields in spectral space,
            and which are overwritten by this function.
+
+        filter_arrays : tuple of 1darrays, optional
+           The arrays (filter_array_z, filter_array_r) of a spectral
+           filter, which is then applied when writing the spectral arrays.
         """
         # Perform the FFT first (along axis 0, which corresponds to z)
         self.fft.transform( interp_array_r, self.spect_buffer_r )
@@ -219,5 +229,5 @@ class SpectralTransformer(object) :
                             self.spect_buffer_p, self.spect_buffer_m )
 
         # Perform the inverse DHT (along axis -1, which corresponds to r)
-        self.dhtp.transform( self.spect_buffer_p, spect_array_p )
-        self.dhtm.transform( self.spect_buffer_m, spect_array_m )
+        self.dhtp.transform( self.spect_buffer_p, spect_array_p, filter_arrays )
+        self.dhtm.transform( self.spect_buffer_m, spect_array_m, filter_arrays )
@@ -1,7 +1,7 @@
 # Copyright 2016, FBPIC contributors
 # Authors: Remi Lehe, Manuel Kirchen
 # License: 3-Clause-BSD-LBNL
-from numba import vectorize, float64, void, njit
+from numba import vectorize, float64, float32, void, njit
 from scipy.constants import c
 inv_c = 1./c
 import numpy as np
@@ -142,12 +142,11 @@ class ExternalField( object ):
                 if i < F.shape[0]:
                     F[i] = inline_func( F[i], x[i], y[i], z[i], t, amplitude, length_scale )
 
-            # To ensure that the kernel is compiled immediately and prevent scoping issues,
-            # it is specialized using an explicit signature
-            gpu_signature = void( float64[:], float64[:], float64[:],
-                               float64[:], float64, float64, float64 )
-
-            self.gpu_func = compile_cupy( external_field_kernel ).specialize( gpu_signature )
+            # The kernel is specialized for the precision of the fields
+            # gathered on the particles (float64 or float32), when it is
+            # first applied to fields of this precision (see `get_gpu_func`)
+            self.gpu_kernel = external_field_kernel
+            self.gpu_funcs = {}
 
         # Convert the field back to the boosted frame
         if (gamma_boost is not None) and (gamma_boost != 1.):
@@ -209,7 +208,31 @@ class ExternalField( object ):
                     else:
                         # Get the threads per block and the blocks per grid
                         dim_grid_1d, dim_block_1d = cuda_tpb_bpg_1d( species.Ntot )
-                        # Call the GPU kernel
-                        self.gpu_func[dim_grid_1d, dim_block_1d](
+                        # Call the GPU kernel (for the precision of `field`)
+                        gpu_func = self.get_gpu_func( field.dtype )
+                        gpu_func[dim_grid_1d, dim_block_1d](
                             field, species.x, species.y, species.z,
                             t, amplitude, self.length_scale )
+
+    def get_gpu_func( self, dtype ):
+        """
+        Return the GPU kernel that applies the external field to an array
+        of fields of type `dtype` (float64 or float32).
+
+        The kernel is specialized using an explicit signature (so that it
+        is compiled immediately), the first time that this function is
+        called for `dtype`, and then reused.
+
+        Parameters
+        ----------
+        dtype: numpy dtype
+            The dtype of the fields gathered on the particles
+        """
+        gpu_func = self.gpu_funcs.get( dtype )
+        if gpu_func is None:
+            field_type = float32 if dtype == np.float32 else float64
+            gpu_signature = void( field_type[:], float64[:], float64[:],
+                                  float64[:], float64, float64, float64 )
+            gpu_func = compile_cupy( self.gpu_kernel ).specialize( gpu_signature )
+            self.gpu_funcs[ dtype ] = gpu_func
+        return( gpu_func )
@@ -108,11 +108,11 @@ def add_laser( sim, a0, w0, ctau, z0, zf=None, lambda0=0.8e-6,
 
     .. math::
 
-        E(\\boldsymbol{x},t) = a_0\\times E_0\,
-        \exp\left( -\\frac{r^2}{w_0^2} - \\frac{(z-z_0-ct)^2}{c^2\\tau^2} \\right)
-        \cos[ k_0( z - z_0 - ct ) - \phi_{cep} ]
+        E(\\boldsymbol{x},t) = a_0\\times E_0\\,
+        \\exp\\left( -\\frac{r^2}{w_0^2} - \\frac{(z-z_0-ct)^2}{c^2\\tau^2} \\right)
+        \\cos[ k_0( z - z_0 - ct ) - \\phi_{cep} ]
 
-    where :math:`k_0 = 2\pi/\\lambda_0` is the wavevector and where
+    where :math:`k_0 = 2\\pi/\\lambda_0` is the wavevector and where
     :math:`E_0 = m_e c^2 k_0 / q_e` is the field amplitude for :math:`a_0=1`.
 
     .. note::
@@ -160,16 +160,16 @@ def add_laser( sim, a0, w0, ctau, z0, zf=None, lambda0=0.8e-6,
         :math:`\\lambda_0` in the above formula.
 
     cep_phase: float (in radian), optional
-        The Carrier Enveloppe Phase (CEP), defined as :math:`\phi_{cep}`
+        The Carrier Enveloppe Phase (CEP), defined as :math:`\\phi_{cep}`
         in the above formula (i.e. the phase of the laser
         oscillation, at the position where the laser enveloppe is maximum)
 
     phi2_chirp: float (in second^2)
         The amount of temporal chirp, at focus (in the lab frame)
         Namely, a wave packet centered on the frequency
-        :math:`(\omega_0 + \delta \omega)` will reach its peak intensity
-        at :math:`z(\delta \omega) = z_0 - c \phi^{(2)} \, \delta \omega`.
-        Thus, a positive :math:`\phi^{(2)}` corresponds to positive chirp,
+        :math:`(\\omega_0 + \\delta \\omega)` will reach its peak intensity
+        at :math:`z(\\delta \\omega) = z_0 - c \\phi^{(2)} \\, \\delta \\omega`.
+        Thus, a positive :math:`\\phi^{(2)}` corresponds to positive chirp,
         i.e. red part of the spectrum in the front of the pulse and blue
         part of the spectrum in the back.
 
@@ -115,11 +115,11 @@ class GaussianLaser( LaserProfile ):
 
         .. math::
 
-            E(\\boldsymbol{x},t) = a_0\\times E_0\,
-            \exp\left( -\\frac{r^2}{w_0^2} - \\frac{(z-z_0-ct)^2}{c^2\\tau^2} \\right)
-            \cos[ k_0( z - z_0 - ct ) - \phi_{cep} ]
+            E(\\boldsymbol{x},t) = a_0\\times E_0\\,
+            \\exp\\left( -\\frac{r^2}{w_0^2} - \\frac{(z-z_0-ct)^2}{c^2\\tau^2} \\right)
+            \\cos[ k_0( z - z_0 - ct ) - \\phi_{cep} ]
 
-        where :math:`k_0 = 2\pi/\\lambda_0` is the wavevector and where
+        where :math:`k_0 = 2\\pi/\\lambda_0` is the wavevector and where
         :math:`E_0 = m_e c^2 k_0 / q_e` is the field amplitude for :math:`a_0=1`.
 
         .. note::
@@ -162,16 +162,16 @@ class GaussianLaser( LaserProfile ):
             Default: 0.8 microns (Ti:Sapph laser).
 
         cep_phase: float (in radian), optional
-            The Carrier Enveloppe Phase (CEP), defined as :math:`\phi_{cep}`
+            The Carrier Enveloppe Phase (CEP), defined as :math:`\\phi_{cep}`
             in the above formula (i.e. the phase of the laser
             oscillation, at the position where the laser enveloppe is maximum)
 
         phi2_chirp: float (in second^2)
             The amount of temporal chirp, at focus (in the lab frame)
             Namely, a wave packet centered on the frequency
-            :math:`(\omega_0 + \delta \omega)` will reach its peak intensity
-            at :math:`z(\delta \omega) = z_0 - c \phi^{(2)} \, \delta \omega`.
-            Thus, a positive :math:`\phi^{(2)}` corresponds to positive chirp,
+            :math:`(\\omega_0 + \\delta \\omega)` will reach its peak intensity
+            at :math:`z(\\delta \\omega) = z_0 - c \\phi^{(2)} \\, \\delta \\omega`.
+            Thus, a positive :math:`\\phi^{(2)}` corresponds to positive chirp,
             i.e. red part of the spectrum in the front of the pulse and blue
             part of the spectrum in the back.
 
@@ -257,18 +257,18 @@ class LaguerreGaussLaser( LaserProfile ):
 
         .. math::
 
-            E(\\boldsymbol{x},t) = a_0\\times E_0 \, f(r, \\theta) \,
-            \exp\left( -\\frac{r^2}{w_0^2} - \\frac{(z-z_0-ct)^2}{c^2\\tau^2}
-            \\right) \cos[ k_0( z - z_0 - ct ) - \phi_{cep} ]
+            E(\\boldsymbol{x},t) = a_0\\times E_0 \\, f(r, \\theta) \\,
+            \\exp\\left( -\\frac{r^2}{w_0^2} - \\frac{(z-z_0-ct)^2}{c^2\\tau^2}
+            \\right) \\cos[ k_0( z - z_0 - ct ) - \\phi_{cep} ]
 
-            \mathrm{with} \qquad f(r, \\theta) =
-            \sqrt{\\frac{p!(2-\delta_{m,0})}{(m+p)!}}
-            \\left( \\frac{\sqrt{2}r}{w_0} \\right)^m
+            \\mathrm{with} \\qquad f(r, \\theta) =
+            \\sqrt{\\frac{p!(2-\\delta_{m,0})}{(m+p)!}}
+            \\left( \\frac{\\sqrt{2}r}{w_0} \\right)^m
             L^m_p\\left( \\frac{2 r^2}{w_0^2} \\right)
-            \cos[ m(\\theta - \\theta_0)]
+            \\cos[ m(\\theta - \\theta_0)]
 
         where :math:`L^m_p` is a Laguerre polynomial,
-        :math:`k_0 = 2\pi/\\lambda_0` is the wavevector and where
+        :math:`k_0 = 2\\pi/\\lambda_0` is the wavevector and where
         :math:`E_0 = m_e c^2 k_0 / q_e`.
 
         (For more info, see
@@ -303,7 +303,7 @@ class LaguerreGaussLaser( LaserProfile ):
         m: int (positive)
             The azimuthal order of the pulse.
             (In the transverse plane, the field of the pulse varies as
-            :math:`\cos[m(\\theta-\\theta_0)]`.)
+            :math:`\\cos[m(\\theta-\\theta_0)]`.)
 
         a0: float (dimensionless)
             The amplitude of the pulse, defined so that the total
@@ -337,7 +337,7 @@ class LaguerreGaussLaser( LaserProfile ):
             Default: 0.8 microns (Ti:Sapph laser).
 
         cep_phase: float (in radian), optional
-            The Carrier Enveloppe Phase (CEP), defined as :math:`\phi_{cep}`
+            The Carrier Enveloppe Phase (CEP), defined as :math:`\\phi_{cep}`
             in the above formula (i.e. the phase of the laser
             oscillation, at the position where the laser enveloppe is maximum)
 
@@ -345,7 +345,7 @@ class LaguerreGaussLaser( LaserProfile ):
             The azimuthal position of (one of) the maxima of intensity, in the
             transverse plane.
             (In the transverse plane, the field of the pulse varies as
-            :math:`\cos[m(\\theta-\\theta_0)]`.)
+            :math:`\\cos[m(\\theta-\\theta_0)]`.)
 
         propagation_direction: int, optional
             Indicates in which direction the laser propagates.
@@ -437,17 +437,17 @@ class DonutLikeLaguerreGaussLaser( LaserProfile ):
 
         .. math::
 
-            E(\\boldsymbol{x},t) = a_0\\times E_0 \, f(r) \,
-            \exp\left( -\\frac{r^2}{w_0^2} - \\frac{(z-z_0-ct)^2}{c^2\\tau^2}
-            \\right) \cos[ k_0( z - z_0 - ct ) - m\\theta - \phi_{cep} ]
+            E(\\boldsymbol{x},t) = a_0\\times E_0 \\, f(r) \\,
+            \\exp\\left( -\\frac{r^2}{w_0^2} - \\frac{(z-z_0-ct)^2}{c^2\\tau^2}
+            \\right) \\cos[ k_0( z - z_0 - ct ) - m\\theta - \\phi_{cep} ]
 
-            \mathrm{with} \qquad f(r) =
-            \sqrt{\\frac{p!}{(|m|+p)!}}
-            \\left( \\frac{\sqrt{2}r}{w_0} \\right)^{|m|}
+            \\mathrm{with} \\qquad f(r) =
+            \\sqrt{\\frac{p!}{(|m|+p)!}}
+            \\left( \\frac{\\sqrt{2}r}{w_0} \\right)^{|m|}
             L^{|m|}_p\\left( \\frac{2 r^2}{w_0^2} \\right)
 
         where :math:`L^m_p` is a Laguerre polynomial,
-        :math:`k_0 = 2\pi/\\lambda_0` is the wavevector and where
+        :math:`k_0 = 2\\pi/\\lambda_0` is the wavevector and where
         :math:`E_0 = m_e c^2 k_0 / q_e`.
 
         (For more info, see
@@ -511,7 +511,7 @@ class DonutLikeLaguerreGaussLaser( LaserProfile ):
             Default: 0.8 microns (Ti:Sapph laser).
 
         cep_phase: float (in radian), optional
-            The Carrier Enveloppe Phase (CEP), defined as :math:`\phi_{cep}`
+            The Carrier Enveloppe Phase (CEP), defined as :math:`\\phi_{cep}`
             in the above formula (i.e. the phase of the laser
             oscillation, at the position where the laser enveloppe is maximum)
 
@@ -599,29 +599,29 @@ class FlattenedGaussianLaser( LaserProfile ):
 
         .. math::
 
-            E(\\boldsymbol{x},t)\propto
-            \exp\\left(-\\frac{r^2}{(N+1)w_0^2}\\right)
-            \sum_{n=0}^N c'_n L^0_n\\left(\\frac{2\,r^2}{(N+1)w_0^2}\\right)
+            E(\\boldsymbol{x},t)\\propto
+            \\exp\\left(-\\frac{r^2}{(N+1)w_0^2}\\right)
+            \\sum_{n=0}^N c'_n L^0_n\\left(\\frac{2\\,r^2}{(N+1)w_0^2}\\right)
 
-            \mathrm{with} \qquad c'_n = \sum_{m=n}^{N}\\frac{1}{2^m}\\binom{m}{n}
+            \\mathrm{with} \\qquad c'_n = \\sum_{m=n}^{N}\\frac{1}{2^m}\\binom{m}{n}
 
-        - For :math:`N=0`, this is a Gaussian profile: :math:`E\propto\exp\\left(-\\frac{r^2}{w_0^2}\\right)`.
+        - For :math:`N=0`, this is a Gaussian profile: :math:`E\\propto\\exp\\left(-\\frac{r^2}{w_0^2}\\right)`.
 
-        - For :math:`N\\rightarrow\infty`, this is a Jinc profile: :math:`E\propto \\frac{J_1(r/w_0)}{r/w_0}`.
+        - For :math:`N\\rightarrow\\infty`, this is a Jinc profile: :math:`E\\propto \\frac{J_1(r/w_0)}{r/w_0}`.
 
         The expression **far from focus** is
 
         .. math::
 
-            E(\\boldsymbol{x},t)\propto
-            \exp\\left(-\\frac{(N+1)r^2}{w(z)^2}\\right)
-            \sum_{n=0}^N \\frac{1}{n!}\left(\\frac{(N+1)\,r^2}{w(z)^2}\\right)^n
+            E(\\boldsymbol{x},t)\\propto
+            \\exp\\left(-\\frac{(N+1)r^2}{w(z)^2}\\right)
+            \\sum_{n=0}^N \\frac{1}{n!}\\left(\\frac{(N+1)\\,r^2}{w(z)^2}\\right)^n
 
-            \mathrm{with} \qquad w(z) = \\frac{\lambda_0}{\pi w_0}|z-z_{foc}|
+            \\mathrm{with} \\qquad w(z) = \\frac{\\lambda_0}{\\pi w_0}|z-z_{foc}|
 
-        - For :math:`N=0`, this is a Gaussian profile: :math:`E\propto\exp\\left(-\\frac{r^2}{w_(z)^2}\\right)`.
+        - For :math:`N=0`, this is a Gaussian profile: :math:`E\\propto\\exp\\left(-\\frac{r^2}{w_(z)^2}\\right)`.
 
-        - For :math:`N\\rightarrow\infty`, this is a flat profile: :math:`E\propto \\Theta(w(z)-r)`.
+        - For :math:`N\\rightarrow\\infty`, this is a flat profile: :math:`E\\propto \\Theta(w(z)-r)`.
 
         Parameters
         ----------
@@ -768,12 +768,12 @@ class FewCycleLaser( LaserProfile ):
 
         .. math::
 
-            E(\\boldsymbol{x},t) = Re\\left[ a_0\\times E_0\,
-            e^{i\phi_{cep}} \\frac{i Z_R}{q(z)}
+            E(\\boldsymbol{x},t) = Re\\left[ a_0\\times E_0\\,
+            e^{i\\phi_{cep}} \\frac{i Z_R}{q(z)}
             \\left( 1 + \\frac{ik_0}{s}\\left(z-z_0-ct+
             \\frac{r^2}{2q(z)}\\right)\\right)^{-(s+1)} \\right]
 
-        where :math:`k_0 = 2\pi/\\lambda_0` is the wavevector,
+        where :math:`k_0 = 2\\pi/\\lambda_0` is the wavevector,
         :math:`E_0 = m_e c^2 k_0 / q_e` is the field amplitude for :math:`a_0=1`,
         :math:`Z_R = k_0 w_0^2/2` is the Rayleigh length,
         :math:`q(z) = z-z_f + iZ_R`, and where :math:`s`
@@ -781,11 +781,11 @@ class FewCycleLaser( LaserProfile ):
 
         .. math::
 
-            \omega_0 \\tau_{FWHM} = s\\sqrt{2(4^{1/(s+1)}-1)}
+            \\omega_0 \\tau_{FWHM} = s\\sqrt{2(4^{1/(s+1)}-1)}
 
         .. note::
 
-            In the case of :math:`\omega_0 \\tau_{FWHM} \gg 1` (i.e. many
+            In the case of :math:`\\omega_0 \\tau_{FWHM} \\gg 1` (i.e. many
             laser cycles within the envelope), the above expression approaches
             that of a standard Gaussian laser pulse, and thus the :any:`FewCycleLaser`
             profile becomes equivalent to the :any:`GaussianLaser` profile
@@ -824,7 +824,7 @@ class FewCycleLaser( LaserProfile ):
             Default: 0.8 microns (Ti:Sapph laser).
 
         cep_phase: float (in radian), optional
-            The Carrier Enveloppe Phase (CEP), defined as :math:`\phi_{cep}`
+            The Carrier Enveloppe Phase (CEP), defined as :math:`\\phi_{cep}`
             in the above formula (i.e. the phase of the laser
             oscillation, at the position where the laser enveloppe is maximum)
 
@@ -60,7 +60,7 @@ class Simulation(object):
                  gamma_boost=None, use_all_mpi_ranks=True,
                  particle_shape='linear', verbose_level=1,
                  smoother=None, use_ruyten_shapes=True,
-                 use_modified_volume=True ):
+                 use_modified_volume=True, particle_field_dtype=np.float64 ):
         """
         Initializes a simulation.
 
@@ -137,6 +137,10 @@ class Simulation(object):
 
         use_cuda: bool, optional
             Whether to use CUDA (GPU) acceleration
+            (When the fields are received back on the CPU, e.g. for the
+            diagnostics, they are written in place into pagelocked arrays
+            that are reused by the next transfer: copy these arrays,
+            e.g. `sim.fld.interp[0].Ez.copy()`, to keep their values.)
 
         n_guard: int, optional
             Number of guard cells to use at the left and right of
@@ -225,17 +229,25 @@ class Simulation(object):
             Whether to use a slightly-modified, effective cell volume, that
             ensures that the charge deposited near the axis is correctly
             taken into account by the spectral cylindrical Maxwell solver.
+
+        particle_field_dtype: numpy dtype, optional
+            The dtype of the fields gathered at the positions of the
+            macroparticles (see the docstring of `Particles`). Passing
+            `np.float32` reduces the memory traffic of the field gathering
+            and particle push (especially on GPUs with low double-precision
+            throughput). The fields on the grid and the positions and
+            momenta of the macroparticles remain in double precision.
         """
         # Check whether to use CUDA
         self.use_cuda = use_cuda
         if self.use_cuda and not cuda_installed:
             warning_message = 'GPU not available for the simulation.\n'
-            if not numba_cuda_installed:
-                warning_message += \
-                '(This is because the `numba` package was not able to find a GPU.)\n'
-            elif not cupy_installed:
+            if not cupy_installed:
                 warning_message += \
                 '(This is because the `cupy` package is not installed.)\n'
+            elif not numba_cuda_installed:
+                warning_message += \
+                '(This is because the `numba` package was not able to find a GPU.)\n'
             warning_message += 'Performing the simulation on CPU.'
             warnings.warn( warning_message )
             self.use_cuda = False
@@ -308,6 +320,7 @@ class Simulation(object):
         # Initialize the electrons and the ions
         self.grid_shape = self.fld.interp[0].Ez.shape
         self.particle_shape = particle_shape
+        self.particle_field_dtype = particle_field_dtype
         self.ptcl = []
         if n_e is not None:
             # - Initialize the electrons
@@ -374,41 +387,63 @@ class Simulation(object):
             Whether to show a progression bar
         """
         # Shortcuts
+        # (Attributes that do not change within the loop are only looked
+        # up once, in order to reduce the Python overhead of each iteration)
         ptcl = self.ptcl
         fld = self.fld
+        comm = self.comm
         dt = self.dt
+        exchange_period = comm.exchange_period
+        moving_win = comm.moving_win
+        multi_proc = (comm.size > 1)
+        use_cuda = self.use_cuda
+        use_galilean = self.use_galilean
+        # Flags that are derived from the arguments of this function
+        # (These do not change within the loop and are thus evaluated once)
+        exchange_rho = (use_true_rho is True)
+        exchange_J = (correct_currents is False)
+        cross_deposit = ( correct_currents and
+                          fld.current_correction == 'cross-deposition' )
+        # (rho at t = (n+1) dt is only used for the current correction,
+        # for the field push with `use_true_rho` and - once transferred
+        # to rho_prev - for the divE correction and the diagnostics)
+        deposit_rho_next = ( correct_currents or use_true_rho
+                             or correct_divE or len(self.diags) > 0 )
         # Sanity check
-        if self.comm.size > 1 and correct_divE:
+        if multi_proc and correct_divE:
             raise ValueError('correct_divE cannot be used in multi-proc mode.')
-        if self.comm.size > 1 and use_true_rho and correct_currents:
+        if multi_proc and use_true_rho and correct_currents:
             raise ValueError('`use_true_rho` cannot be used together '
                             'with `correct_currents` in multi-proc mode.')
             # This is because use_true_rho requires the guard cells of
             # rho to be exchanged while correct_currents requires the opposite.
 
         # Initialize the positions for continuous injection by moving window
-        if self.comm.moving_win is not None:
-            for species in self.ptcl:
+        if moving_win is not None:
+            for species in ptcl:
                 if species.continuous_injection:
                     species.injector.initialize_injection_positions(
-                        self.comm, self.comm.moving_win.v, species.z, self.dt )
+                        comm, moving_win.v, species.z, dt )
 
         # Initialize variables to measure the time taken by the simulation
-        if show_progress and self.comm.rank==0:
+        # (Only the first proc measures the time and prints the progress)
+        show_progress = show_progress and (comm.rank == 0)
+        if show_progress:
             progress_bar = ProgressBar( N )
 
         # Send simulation data to GPU (if CUDA is used)
-        if self.use_cuda:
+        # (The initial charge density rho_prev is only deposited at the
+        # first iteration of the loop below, i.e. after this transfer:
+        # it is thus computed on the GPU, and not in `__init__` on the CPU)
+        if use_cuda:
             send_data_to_gpu(self)
 
         # Get the E and B fields in spectral space initially
         # (In the rest of the loop, E and B will only be transformed
         # from spectal space to real space, but never the other way around)
-        self.comm.exchange_fields(fld.interp, 'E', 'replace')
-        self.comm.exchange_fields(fld.interp, 'B', 'replace')
-        self.comm.damp_EB_open_boundary( fld.interp )
-        fld.interp2spect('E')
-        fld.interp2spect('B')
+        comm.exchange_fields(fld.interp, 'EB', 'replace')
+        comm.damp_EB_open_boundary( fld.interp )
+        fld.interp2spect('EB')
         if self.use_pml:
             fld.interp2spect('E_pml')
             fld.interp2spect('B_pml')
@@ -416,11 +451,15 @@ class Simulation(object):
         # Beginning of the N iterations
         # -----------------------------
 
+        # Number of iterations until the next particle exchange
+        # (0 at the first iteration of the loop: see below)
+        exchange_countdown = 0
+
         # Loop over timesteps
         for i_step in range(N):
 
             # Show a progression bar and calculate ETA
-            if show_progress and self.comm.rank==0:
+            if show_progress:
                 progress_bar.time( i_step )
                 progress_bar.print_progress()
 
@@ -430,46 +469,52 @@ class Simulation(object):
             # Check whether this iteration involves particle exchange.
             # Note: Particle exchange is imposed at the first iteration
             # of this loop (i_step == 0) in order to ensure that all
-            # particles are inside the box, and that 'rho_prev' is correct
-            if self.iteration % self.comm.exchange_period == 0 or i_step == 0:
+            # particles are inside the box, and that 'rho_prev' is correct.
+            # Afterwards, it occurs when self.iteration is a multiple
+            # of exchange_period (tracked by counting down the iterations)
+            if exchange_countdown == 0:
+                exchange_countdown = \
+                    exchange_period - 1 - self.iteration % exchange_period
                 # Particle exchange includes MPI exchange of particles, removal
                 # of out-of-box particles and (if there is a moving window)
                 # continuous injection of new particles by the moving window.
                 # (In the case of single-proc periodic simulations, particles
                 # are shifted by one box length, so they remain inside the box)
-                for species in self.ptcl:
-                    self.comm.exchange_particles(species, fld, self.time)
+                for species in ptcl:
+                    comm.exchange_particles(species, fld, self.time)
                 for antenna in self.laser_antennas:
-                    antenna.update_current_rank(self.comm)
+                    antenna.update_current_rank(comm)
 
                 # Reproject the charge on the interpolation grid
                 # (Since particles have been removed / added to the simulation;
                 # otherwise rho_prev is obtained from the previous iteration.)
-                self.deposit('rho_prev', exchange=(use_true_rho is True))
+                self.deposit('rho_prev', exchange=exchange_rho)
 
                 # For simulations on GPU, clear the memory pool used by cupy.
-                if self.use_cuda:
+                if use_cuda:
                     mempool = cupy.get_default_memory_pool()
                     mempool.free_all_blocks()
+            else:
+                exchange_countdown -= 1
 
             # For the field diagnostics of the first step: deposit J
             # (Note however that this is not the *corrected* current)
-            if i_step == 0:
+            # (Without diagnostics, this J would be overwritten before
+            # being used: skip this extra pass over the particles)
+            if i_step == 0 and self.diags:
                 self.deposit('J', exchange=True)
 
             # Main PIC iteration
             # ------------------
 
-            # Keep field arrays sorted throughout gathering+push
-            for species in ptcl:
-                species.keep_fields_sorted = True
-
             # Gather the fields from the grid at t = n dt
+            # (and keep field arrays sorted throughout gathering+push)
             for species in ptcl:
-                species.gather( fld.interp, self.comm )
+                species.keep_fields_sorted = True
+                species.gather( fld.interp, comm )
             # Apply the external fields at t = n dt
             for ext_field in self.external_fields:
-                ext_field.apply_expression( self.ptcl, self.time )
+                ext_field.apply_expression( ptcl, self.time )
 
             # Run the diagnostics
             # (after gathering ; allows output of gathered fields on particles)
@@ -481,18 +526,20 @@ class Simulation(object):
                 diag.write( self.iteration )
 
             # Push the particles' positions and velocities to t = (n+1/2) dt
-            if move_momenta:
-                for species in ptcl:
-                    species.push_p( self.time + 0.5*self.dt )
-            if move_positions:
+            # (Each species is pushed independently of the others, so that
+            # both pushes are done within a single loop over the species)
+            if move_momenta or move_positions:
                 for species in ptcl:
-                    species.push_x( 0.5*dt )
+                    if move_momenta:
+                        species.push_p( self.time + 0.5*dt )
+                    if move_positions:
+                        species.push_x( 0.5*dt )
             # Get positions/velocities for antenna particles at t = (n+1/2) dt
             for antenna in self.laser_antennas:
                 antenna.update_v( self.time + 0.5*dt )
                 antenna.push_x( 0.5*dt )
             # Shift the boundaries of the grid for the Galilean frame
-            if self.use_galilean:
+            if use_galilean:
                 self.shift_galilean_boundaries( 0.5*dt )
 
             # Handle elementary processes at t = (n + 1/2)dt
@@ -507,9 +554,9 @@ class Simulation(object):
 
             # Get the current at t = (n+1/2) dt
             # (Guard cell exchange done either now or after current correction)
-            self.deposit('J', exchange=(correct_currents is False))
+            self.deposit('J', exchange=exchange_J)
             # Perform cross-deposition if needed
-            if correct_currents and fld.current_correction=='cross-deposition':
+            if cross_deposit:
                 self.cross_deposit( move_positions )
 
             # Push the particles' positions to t = (n+1) dt
@@ -520,32 +567,37 @@ class Simulation(object):
             for antenna in self.laser_antennas:
                 antenna.push_x( 0.5*dt )
             # Shift the boundaries of the grid for the Galilean frame
-            if self.use_galilean:
+            if use_galilean:
                 self.shift_galilean_boundaries( 0.5*dt )
 
             # Get the charge density at t = (n+1) dt
-            self.deposit('rho_next', exchange=(use_true_rho is True))
+            # (At the last step, it is always deposited, so that rho
+            # on the grid is up-to-date when this function returns)
+            if deposit_rho_next or i_step == N-1:
+                self.deposit('rho_next', exchange=exchange_rho)
             # Correct the currents (requires rho at t = (n+1) dt )
             if correct_currents:
-                fld.correct_currents( check_exchanges=(self.comm.size > 1) )
-                if self.comm.size > 1:
+                fld.correct_currents( check_exchanges=multi_proc )
+                if multi_proc:
                     # Exchange the guard cells of corrected J between domains
                     # (If correct_currents is False, the exchange of J
                     # is done in the function `deposit`)
                     fld.spect2partial_interp('J')
-                    self.comm.exchange_fields(fld.interp, 'J', 'add')
+                    comm.exchange_fields(fld.interp, 'J', 'add')
                     fld.partial_interp2spect('J')
                 fld.exchanged_source['J'] = True
 
             # Push the fields E and B on the spectral grid to t = (n+1) dt
-            fld.push( use_true_rho, check_exchanges=(self.comm.size > 1) )
+            fld.push( use_true_rho, check_exchanges=multi_proc )
             if correct_divE:
                 fld.correct_divE()
             # Move the grids if needed
-            if self.comm.moving_win is not None:
+            if moving_win is not None:
                 # Shift the fields is spectral space and update positions of
                 # the interpolation grids
-                self.comm.move_grids(fld, ptcl, dt, self.time)
+                # (This is done before `exchange_and_damp_EB`, so that the
+                # single exchange of E and B below also covers the shift.)
+                comm.move_grids(fld, ptcl, dt, self.time)
 
             # Handle boundaries for the E and B fields:
             # - MPI exchanges for guard cells
@@ -569,18 +621,18 @@ class Simulation(object):
         # Finalize PIC loop
         # Get the charge density and the current from spectral space.
         fld.spect2interp('J')
-        if (not fld.exchanged_source['J']) and (self.comm.size > 1):
-            self.comm.exchange_fields(self.fld.interp, 'J', 'add')
+        if (not fld.exchanged_source['J']) and multi_proc:
+            comm.exchange_fields(fld.interp, 'J', 'add')
         fld.spect2interp('rho_prev')
-        if (not fld.exchanged_source['rho_prev']) and (self.comm.size > 1):
-            self.comm.exchange_fields(self.fld.interp, 'rho', 'add')
+        if (not fld.exchanged_source['rho_prev']) and multi_proc:
+            comm.exchange_fields(fld.interp, 'rho', 'add')
 
         # Receive simulation data from GPU (if CUDA is used)
-        if self.use_cuda:
+        if use_cuda:
             receive_data_from_gpu(self)
 
         # Print the measured time taken by the PIC cycle
-        if show_progress and (self.comm.rank==0):
+        if show_progress:
             progress_bar.print_summary()
 
 
@@ -661,9 +713,8 @@ class Simulation(object):
 
         # Get the charge or currents on the spectral grid
         if update_spectral:
-            fld.interp2spect( fieldtype )
-            if self.filter_currents:
-                fld.filter_spect( fieldtype )
+            # (The filter is applied within the transform, when needed)
+            fld.interp2spect( fieldtype, filtered=self.filter_currents )
             # Set the flag to indicate whether these fields have been exchanged
             fld.exchanged_source[ fieldtype ] = exchange
 
@@ -725,12 +776,19 @@ class Simulation(object):
         # Shortcut
         fld = self.fld
 
+        # - For single-proc periodic simulations, there are no guard cells
+        #   nor damping cells in z: skip the iFFT/FFT round trip and
+        #   directly update the fields in interpolation space
+        if self.comm.size == 1 and self.comm.nz_damp == 0 \
+                and not self.use_pml and not self.mirrors:
+            fld.spect2interp('EB')
+            return
+
         # - Get fields in interpolation space (or partial interpolation space)
         #   to prepare for damp/exchange
         if self.use_pml:
             # Exchange/damp operation in z and r ; do full transform
-            fld.spect2interp('E')
-            fld.spect2interp('B')
+            fld.spect2interp('EB')
             fld.spect2interp('E_pml')
             fld.spect2interp('B_pml')
         else:
@@ -740,8 +798,7 @@ class Simulation(object):
             fld.spect2partial_interp('B')
 
         # - Exchange guard cells and damp fields
-        self.comm.exchange_fields(fld.interp, 'E', 'replace')
-        self.comm.exchange_fields(fld.interp, 'B', 'replace')
+        self.comm.exchange_fields(fld.interp, 'EB', 'replace')
         self.comm.damp_EB_open_boundary( fld.interp ) # Damp along z
         if self.use_pml:
             self.comm.damp_pml_EB( fld.interp ) # Damp in radial PML
@@ -753,8 +810,7 @@ class Simulation(object):
         # - Update spectral space (and interpolation space if needed)
         if self.use_pml:
             # Exchange/damp operation in z and r ; do full transform back
-            fld.interp2spect('E')
-            fld.interp2spect('B')
+            fld.interp2spect('EB')
             fld.interp2spect('E_pml')
             fld.interp2spect('B_pml')
         else:
@@ -763,8 +819,7 @@ class Simulation(object):
             fld.partial_interp2spect('E')
             fld.partial_interp2spect('B')
             # Get the corresponding fields in interpolation space
-            fld.spect2interp('E')
-            fld.spect2interp('B')
+            fld.spect2interp('EB')
 
 
     def shift_galilean_boundaries(self, dt):
@@ -924,10 +979,12 @@ class Simulation(object):
 
             # Modify again the input particle bounds, so that
             # they fall exactly on the grid, and infer the number of particles
-            p_zmin, p_zmax, Npz = adapt_to_grid( self.fld.interp[0].z,
-                                p_zmin, p_zmax, p_nz )
-            p_rmin, p_rmax, Npr = adapt_to_grid( self.fld.interp[0].r,
-                                p_rmin, p_rmax, p_nr )
+            # (The gridpoints are at the center of the cells)
+            grid = self.fld.interp[0]
+            p_zmin, p_zmax, Npz = adapt_to_grid( grid.zmin + 0.5*grid.dz,
+                                grid.dz, grid.Nz, p_zmin, p_zmax, p_nz )
+            p_rmin, p_rmax, Npr = adapt_to_grid( grid.rmin + 0.5*grid.dr,
+                                grid.dr, grid.Nr, p_rmin, p_rmax, p_nr )
             dz_particles = self.comm.dz/p_nz
 
         else:
@@ -957,7 +1014,8 @@ class Simulation(object):
                         ux_m=ux_m, uy_m=uy_m, uz_m=uz_m,
                         ux_th=ux_th, uy_th=uy_th, uz_th=uz_th,
                         continuous_injection=continuous_injection,
-                        dz_particles=dz_particles )
+                        dz_particles=dz_particles,
+                        field_dtype=self.particle_field_dtype )
 
         # Add it to the list of species and return it to the user
         self.ptcl.append( new_species )
@@ -1016,7 +1074,7 @@ class Simulation(object):
             species.uy *= -1
             species.uz *= -1
 
-def adapt_to_grid( x, p_xmin, p_xmax, p_nx, ncells_empty=0 ):
+def adapt_to_grid( xmin, dx, Nx, p_xmin, p_xmax, p_nx, ncells_empty=0 ):
     """
     Adapt p_xmin and p_xmax, so that they fall exactly on the grid x
     Return the total number of particles, assuming p_nx particles
@@ -1024,8 +1082,14 @@ def adapt_to_grid( x, p_xmin, p_xmax, p_nx, ncells_empty=0 ):
 
     Parameters
     ----------
-    x: 1darray
-        The positions of the gridpoints along the x direction
+    xmin: float
+        The position of the first gridpoint along the x direction
+
+    dx: float
+        The spacing between the (uniformly-spaced) gridpoints
+
+    Nx: int
+        The number of gridpoints along the x direction
 
     p_xmin, p_xmax: float
         The minimal and maximal position of the particles
@@ -1046,10 +1110,8 @@ def adapt_to_grid( x, p_xmin, p_xmax, p_nx, ncells_empty=0 ):
        - Npx: the total number of particles
     """
 
-    # Find the max and the step of the array
-    xmin = x.min()
-    xmax = x.max()
-    dx = x[1] - x[0]
+    # Find the position of the last gridpoint
+    xmax = xmin + (Nx-1)*dx
 
     # Do not load particles below the lower bound of the box
     if p_xmin < xmin - 0.5*dx:
@@ -1062,13 +1124,16 @@ def adapt_to_grid( x, p_xmin, p_xmax, p_nx, ncells_empty=0 ):
     if p_xmax > xmax + (0.5-ncells_empty)*dx:
         p_xmax = xmax + (0.5-ncells_empty)*dx
 
-    # Find the gridpoints on which the particles should be loaded
-    x_load = x[ ( x > p_xmin ) & ( x < p_xmax ) ]
+    # Find the indices of the first and last gridpoints on which the
+    # particles should be loaded, i.e. such that p_xmin < x[i] < p_xmax
+    # (The small tolerance excludes gridpoints that coincide with the bounds)
+    i_min = max( int(np.floor( (p_xmin - xmin)/dx + 1.e-9 )) + 1, 0 )
+    i_max = min( int(np.ceil( (p_xmax - xmin)/dx - 1.e-9 )) - 1, Nx - 1 )
     # Deduce the total number of particles
-    Npx = len(x_load) * p_nx
+    Npx = max( i_max - i_min + 1, 0 ) * p_nx
     # Reajust p_xmin and p_xmanx so that they match the grid
     if Npx > 0:
-        p_xmin = x_load.min() - 0.5*dx
-        p_xmax = x_load.max() + 0.5*dx
+        p_xmin = xmin + (i_min - 0.5)*dx
+        p_xmax = xmin + (i_max + 0.5)*dx
 
     return( p_xmin, p_xmax, Npx )
@@ -199,7 +199,7 @@ def check_restart( sim, iteration, checkpoint_dir ):
     # Infer the number of processors that were used for the checkpoint
     # and check that it is the same as the current number of processors
     nproc = 0
-    regex_matcher = re.compile('proc\d+')
+    regex_matcher = re.compile(r'proc\d+')
     for directory in os.listdir(checkpoint_dir):
         if regex_matcher.match(directory) is not None:
             nproc += 1
@@ -351,12 +351,12 @@ def load_species( species, name, ts, iteration, comm, openpmd_viewer_version ):
         assert getattr( species, attr ).dtype == np.float64
 
     # Field arrays
-    species.Ez = np.zeros( Ntot )
-    species.Ex = np.zeros( Ntot )
-    species.Ey = np.zeros( Ntot )
-    species.Bz = np.zeros( Ntot )
-    species.Bx = np.zeros( Ntot )
-    species.By = np.zeros( Ntot )
+    species.Ez = np.zeros( Ntot, dtype=species.field_dtype )
+    species.Ex = np.zeros( Ntot, dtype=species.field_dtype )
+    species.Ey = np.zeros( Ntot, dtype=species.field_dtype )
+    species.Bz = np.zeros( Ntot, dtype=species.field_dtype )
+    species.Bx = np.zeros( Ntot, dtype=species.field_dtype )
+    species.By = np.zeros( Ntot, dtype=species.field_dtype )
     # Sorting arrays
     if species.use_cuda:
         # cell_idx and sorted_idx always stay on GPU
@@ -367,4 +367,7 @@ def load_species( species, name, ts, iteration, comm, openpmd_viewer_version ):
         species.sorting_buffer = np.empty( Ntot, dtype=np.float64)
         if hasattr( species, 'int_sorting_buffer'):
             species.int_sorting_buffer = np.empty( Ntot, dtype=np.uint64 )
+        if hasattr( species, 'field_sorting_buffer'):
+            species.field_sorting_buffer = \
+                np.empty( Ntot, dtype=species.field_dtype )
         species.sorted = False
@@ -93,7 +93,8 @@ def reallocate_and_copy_old( species, use_cuda, old_Ntot, new_Ntot ):
     for attr in ['x', 'y', 'z', 'ux', 'uy', 'uz', 'w', 'inv_gamma',
                     'Ex', 'Ey', 'Ez', 'Bx', 'By', 'Bz']:
         old_array = getattr(species, attr)
-        new_array = allocate_empty( new_Ntot, data_on_gpu, dtype=np.float64 )
+        new_array = allocate_empty( new_Ntot, data_on_gpu,
+                                    dtype=old_array.dtype )
         if data_on_gpu:
             copy_particle_data_cuda[ ptcl_grid_1d, ptcl_block_1d ](
                 old_Ntot, old_array, new_array )
@@ -119,6 +120,9 @@ def reallocate_and_copy_old( species, use_cuda, old_Ntot, new_Ntot ):
         if species.n_integer_quantities > 0:
             species.int_sorting_buffer = \
                 cupy.empty( (new_Ntot,), dtype=np.uint64 )
+        if hasattr( species, 'field_sorting_buffer' ):
+            species.field_sorting_buffer = \
+                cupy.empty( (new_Ntot,), dtype=species.field_dtype )
 
     # Modify the total number of particles
     species.Ntot = new_Ntot
@@ -217,7 +217,10 @@ def generate_evenly_spaced( Npz, zmin, zmax, Npr, rmin, rmax,
 
         # Get the corresponding particles positions
         # (copy=True is important here, since it allows to
-        # change the angles individually)
+        # change the angles individually ; indexing='ij' orders the
+        # particles with z varying slowest and theta varying fastest, so
+        # that particles which deposit to the same cells are contiguous
+        # in memory, which improves cache reuse on CPU)
         zp, rp, thetap = np.meshgrid( z_reg, r_reg, theta_reg,
                                     copy=True, indexing='ij' )
         # Prevent the particles from being aligned along any direction
@@ -280,7 +283,7 @@ def unalign_angles( thetap, Npz, Npr, method='irrational' ) :
     Parameters
     ----------
     thetap : 3darray of floats
-        An array of shape (Npr, Npz, Nptheta) containing the angular
+        An array of shape (Npz, Npr, Nptheta) containing the angular
         positions of the particles, and which is modified by this function.
 
     Npz, Npr : ints
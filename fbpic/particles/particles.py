@@ -32,7 +32,7 @@ from fbpic.utils.cuda import cuda_installed
 if cuda_installed:
     # Load the CUDA methods
     import cupy    
-    from fbpic.utils.cuda import cuda_tpb_bpg_1d, cuda_gpu_model
+    from fbpic.utils.cuda import cuda_tpb_bpg_1d, get_gpu_model
     from .push.cuda_methods import push_p_gpu, push_p_ioniz_gpu, \
                                 push_p_after_plane_gpu, push_x_gpu
     from .deposition.cuda_methods import deposit_rho_gpu_linear, \
@@ -67,7 +67,8 @@ class Particles(object) :
                     ux_th=0., uy_th=0., uz_th=0.,
                     dens_func=None, continuous_injection=True,
                     grid_shape=None, particle_shape='linear',
-                    use_cuda=False, dz_particles=None ):
+                    use_cuda=False, dz_particles=None,
+                    field_dtype=np.float64 ):
         """
         Initialize a uniform set of particles
 
@@ -137,6 +138,13 @@ class Particles(object) :
             from the arguments `zmin`, `zmax` and `Npz`. However, when
             there are no particles in the initial box (`Npz = 0`),
             `dz_particles` needs to be explicitly passed.
+
+        field_dtype: numpy dtype, optional
+            The dtype of the arrays that store the fields gathered at
+            the positions of the particles (`Ex`, `Ey`, `Ez`, `Bx`, `By`,
+            `Bz`). Using `np.float32` halves the memory traffic of the
+            field gathering and particle push, while the positions and
+            momenta of the particles are still stored in double precision.
         """
         # Define whether or not to use the GPU
         self.use_cuda = use_cuda
@@ -170,12 +178,13 @@ class Particles(object) :
         self.w = w
 
         # Initialize the fields array (at the positions of the particles)
-        self.Ez = np.zeros( Ntot )
-        self.Ex = np.zeros( Ntot )
-        self.Ey = np.zeros( Ntot )
-        self.Bz = np.zeros( Ntot )
-        self.Bx = np.zeros( Ntot )
-        self.By = np.zeros( Ntot )
+        self.field_dtype = field_dtype
+        self.Ez = np.zeros( Ntot, dtype=field_dtype )
+        self.Ex = np.zeros( Ntot, dtype=field_dtype )
+        self.Ey = np.zeros( Ntot, dtype=field_dtype )
+        self.Bz = np.zeros( Ntot, dtype=field_dtype )
+        self.Bx = np.zeros( Ntot, dtype=field_dtype )
+        self.By = np.zeros( Ntot, dtype=field_dtype )
 
         # The particle injector stores information that is useful in order
         # continuously inject particles in the simulation, with moving window
@@ -223,6 +232,10 @@ class Particles(object) :
             # sorting buffers are initialized on CPU like other particle arrays
             # (because they are swapped with these arrays during sorting)
             self.sorting_buffer = np.empty( Ntot, dtype=np.float64)
+            # (When the fields on the particles are not in double precision,
+            # they are swapped with a separate buffer of their dtype)
+            if field_dtype != np.float64:
+                self.field_sorting_buffer = np.empty( Ntot, dtype=field_dtype)
 
             # Register integer thta records shift in the indices,
             # induced by the moving window
@@ -235,40 +248,47 @@ class Particles(object) :
                 self.deposit_tpb = 32
                 self.gather_tpb = 256
             else:
-                self.deposit_tpb = 16 if cuda_gpu_model == "V100" else 8
+                self.deposit_tpb = 16 if get_gpu_model() == "V100" else 8
                 self.gather_tpb = 128
 
 
-    def send_particles_to_gpu( self ):
+    def get_arraynames( self ):
+        """
+        Return the names of the particle arrays that are
+        transferred between the CPU and the GPU by
+        `send_particles_to_gpu` and `receive_particles_from_gpu`.
+        """
+        arraynames = [ 'x', 'y', 'z', 'ux', 'uy', 'uz', 'inv_gamma', 'w',
+                'Ex', 'Ey', 'Ez', 'Bx', 'By', 'Bz', 'sorting_buffer' ]
+        if self.n_integer_quantities > 0:
+            arraynames.append( 'int_sorting_buffer' )
+        if hasattr( self, 'field_sorting_buffer' ):
+            arraynames.append( 'field_sorting_buffer' )
+        return( arraynames )
+
+    def send_particles_to_gpu( self, stream=None ):
         """
         Copy the particles to the GPU.
         Particle arrays of self now point to the GPU arrays.
+
+        Parameters
+        ----------
+        stream: cupy.cuda.Stream, optional
+            The stream on which the copies of the particle arrays
+            are issued (asynchronously)
         """
         if self.use_cuda:
-            # Send positions, velocities, inverse gamma and weights
-            # to the GPU (CUDA)
-            self.x = cupy.asarray(self.x)
-            self.y = cupy.asarray(self.y)
-            self.z = cupy.asarray(self.z)
-            self.ux = cupy.asarray(self.ux)
-            self.uy = cupy.asarray(self.uy)
-            self.uz = cupy.asarray(self.uz)
-            self.inv_gamma = cupy.asarray(self.inv_gamma)
-            self.w = cupy.asarray(self.w)
-
-            # Copy arrays on the GPU for the field
-            # gathering and the particle push
-            self.Ex = cupy.asarray(self.Ex)
-            self.Ey = cupy.asarray(self.Ey)
-            self.Ez = cupy.asarray(self.Ez)
-            self.Bx = cupy.asarray(self.Bx)
-            self.By = cupy.asarray(self.By)
-            self.Bz = cupy.asarray(self.Bz)
-
-            # Copy sorting buffers on the GPU
-            self.sorting_buffer = cupy.asarray(self.sorting_buffer)
-            if self.n_integer_quantities > 0:
-                self.int_sorting_buffer = cupy.asarray(self.int_sorting_buffer)
+            # Send positions, velocities, inverse gamma and weights,
+            # the arrays for the field gathering and the particle push,
+            # and the sorting buffers to the GPU (CUDA)
+            # (Unlike for the fields, the CPU arrays are not pagelocked:
+            # the number of particles changes between transfers, so that
+            # persistent pinned buffers would need to be reallocated.)
+            for name in self.get_arraynames():
+                array = getattr( self, name )
+                d_array = cupy.empty( array.shape, dtype=array.dtype )
+                d_array.set( array, stream=stream )
+                setattr( self, name, d_array )
 
             # Copy particle tracker data
             if self.tracker is not None:
@@ -280,37 +300,23 @@ class Particles(object) :
             # Modify flag accordingly
             self.data_is_on_gpu = True
 
-    def receive_particles_from_gpu( self ):
+    def receive_particles_from_gpu( self, stream=None ):
         """
         Receive the particles from the GPU.
         Particle arrays are accessible by the CPU again.
+
+        Parameters
+        ----------
+        stream: cupy.cuda.Stream, optional
+            The stream on which the copies of the particle arrays
+            are issued (asynchronously)
         """
         if self.use_cuda:
-            # Copy the positions, velocities, inverse gamma and weights
-            # to the GPU (CUDA)
-            self.x = self.x.get()
-            self.y = self.y.get()
-            self.z = self.z.get()
-            self.ux = self.ux.get()
-            self.uy = self.uy.get()
-            self.uz = self.uz.get()
-            self.inv_gamma = self.inv_gamma.get()
-            self.w = self.w.get()
-
-            # Copy arrays on the CPU for the field
-            # gathering and the particle push
-            self.Ex = self.Ex.get()
-            self.Ey = self.Ey.get()
-            self.Ez = self.Ez.get()
-            self.Bx = self.Bx.get()
-            self.By = self.By.get()
-            self.Bz = self.Bz.get()
-
-            # Copy arrays on the CPU
-            # that represent the sorting arrays
-            self.sorting_buffer = self.sorting_buffer.get()
-            if self.n_integer_quantities > 0:
-                self.int_sorting_buffer = self.int_sorting_buffer.get()
+            # Copy the positions, velocities, inverse gamma and weights,
+            # the arrays for the field gathering and the particle push,
+            # and the sorting buffers to the CPU
+            for name in self.get_arraynames():
+                setattr( self, name, getattr( self, name ).get(stream=stream) )
 
             # Copy particle tracker data
             if self.tracker is not None:
@@ -514,9 +520,10 @@ class Particles(object) :
         attr_list = [ (self,'x'), (self,'y'), (self,'z'), \
                         (self,'ux'), (self,'uy'), (self,'uz'), \
                         (self, 'w'), (self,'inv_gamma') ]
-        if self.keep_fields_sorted:
-            attr_list += [ (self, 'Ex'), (self, 'Ey'), (self, 'Ez'), \
+        field_attr_list = [ (self, 'Ex'), (self, 'Ey'), (self, 'Ez'), \
                             (self, 'Bx'), (self, 'By'), (self, 'Bz') ]
+        if self.keep_fields_sorted and self.field_dtype == np.float64:
+            attr_list += field_attr_list
         if self.ionizer is not None:
             attr_list += [ (self.ionizer,'w_times_level') ]
         for attr in attr_list:
@@ -530,6 +537,16 @@ class Particles(object) :
             setattr( attr[0], attr[1], self.sorting_buffer)
             # Assign the old particle data array to the particle buffer
             self.sorting_buffer = particle_array
+        # Iterate over the field arrays, if they are not in double precision
+        # (In this case, they cannot be swapped with the sorting buffer ;
+        # a separate buffer of the right dtype is used instead)
+        if self.keep_fields_sorted and self.field_dtype != np.float64:
+            for attr in field_attr_list:
+                particle_array = getattr( attr[0], attr[1] )
+                write_sorting_buffer[dim_grid_1d, dim_block_1d](
+                    self.sorted_idx, particle_array, self.field_sorting_buffer)
+                setattr( attr[0], attr[1], self.field_sorting_buffer)
+                self.field_sorting_buffer = particle_array
         # Iterate over (integer) particle attributes
         attr_list = [ ]
         if self.tracker is not None:
@@ -40,16 +40,20 @@ def push_x_gpu( x, y, z, ux, uy, uz, inv_gamma, dt,
         e.g. if x_push=1., the particles are pushed forward in x
              if x_push=-1., the particles are pushed backward in x
     """
-    # Timestep multiplied by c
-    cdt = c*dt
+    # Timestep multiplied by c and by the push coefficients
+    # (Computed in the same order as in `push_x_numba`, so that
+    # the CPU and GPU pushes give the same roundoff)
+    cdt_x = c*dt*x_push
+    cdt_y = c*dt*y_push
+    cdt_z = c*dt*z_push
 
     i = cuda.grid(1)
     if i < x.shape[0]:
         # Particle push
         inv_g = inv_gamma[i]
-        x[i] += cdt*x_push*inv_g*ux[i]
-        y[i] += cdt*y_push*inv_g*uy[i]
-        z[i] += cdt*z_push*inv_g*uz[i]
+        x[i] += cdt_x*inv_g*ux[i]
+        y[i] += cdt_y*inv_g*uy[i]
+        z[i] += cdt_z*inv_g*uz[i]
 
 @compile_cupy
 def push_p_gpu( ux, uy, uz, inv_gamma,
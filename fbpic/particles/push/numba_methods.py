@@ -20,14 +20,18 @@ def push_x_numba( x, y, z, ux, uy, uz, inv_gamma, Ntot, dt,
     Advance the particles' positions over `dt` using the momenta ux, uy, uz,
     multiplied by the scalar coefficients x_push, y_push, z_push.
     """
-    # Half timestep, multiplied by c
-    chdt = c*dt
+    # Half timestep, multiplied by c and by the push coefficients
+    # (Computed once outside of the loop: the loop body then reduces to
+    # a few multiply-adds over contiguous arrays, which vectorizes well)
+    chdt_x = c*dt*push_x
+    chdt_y = c*dt*push_y
+    chdt_z = c*dt*push_z
 
     # Particle push (in parallel if threading is installed)
     for ip in prange(Ntot) :
-        x[ip] += chdt * inv_gamma[ip] * push_x * ux[ip]
-        y[ip] += chdt * inv_gamma[ip] * push_y * uy[ip]
-        z[ip] += chdt * inv_gamma[ip] * push_z * uz[ip]
+        x[ip] += chdt_x * inv_gamma[ip] * ux[ip]
+        y[ip] += chdt_y * inv_gamma[ip] * uy[ip]
+        z[ip] += chdt_z * inv_gamma[ip] * uz[ip]
 
     return x, y, z
 
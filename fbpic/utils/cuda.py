@@ -5,25 +5,33 @@
 This file is part of the Fourier-Bessel Particle-In-Cell code (FB-PIC)
 It defines a set of generic functions that operate on a GPU.
 """
+import os
+import json
+import functools
+import hashlib
+import inspect
+import tempfile
 import numba
+from fbpic import __version__ as fbpic_version
 numba_minor_version = int(numba.__version__.split('.')[1])
 from numba import cuda
-import numpy as np
 
-# Check if CUDA is available and set variable accordingly
-try:
-    numba_cuda_installed = cuda.is_available()
-except Exception:
-    numba_cuda_installed = False
-
-if numba_cuda_installed:
-    # Infer if GPU is P100 or V100 or other
-    if "P100" in str(cuda.gpus[0]._device.name):
-        cuda_gpu_model = "P100"
-    elif "V100" in str(cuda.gpus[0]._device.name):
-        cuda_gpu_model = "V100"
-    else:
-        cuda_gpu_model = "other"
+@functools.lru_cache(maxsize=1)
+def is_cuda_available():
+    """
+    Check whether numba can find a GPU.
+
+    The check (which loads the CUDA driver) is only performed the first
+    time that this function is called, and the result is cached.
+
+    Returns :
+    ---------
+    A boolean
+    """
+    try:
+        return( cuda.is_available() )
+    except Exception:
+        return( False )
 
 try:
     import cupy
@@ -33,12 +41,61 @@ except (ImportError, AssertionError):
     cupy_installed = False
     cupy_major_version = None
 
+# Check if CUDA is available and set variable accordingly
+# (The GPU is only probed through numba if cupy is available, since
+# both are needed: on machines without cupy, the CUDA driver is not loaded.)
+numba_cuda_installed = cupy_installed and is_cuda_available()
 cuda_installed = (numba_cuda_installed and cupy_installed)
 
+# Check if the environment variable FBPIC_DISABLE_CACHING is set to 1
+# and in that case, disable the caching of the compiled GPU kernels
+# (as for the caching of the CPU functions)
+caching = True
+if 'FBPIC_DISABLE_CACHING' in os.environ:
+    if int(os.environ['FBPIC_DISABLE_CACHING']) == 1:
+        caching = False
+
+# Directory where the PTX code of the kernels compiled by `compile_cupy` is
+# stored, so that new processes do not need to recompile them.
+ptx_cache_dir = None
+if caching:
+    ptx_cache_dir = os.environ.get( 'FBPIC_CACHE_DIR',
+            os.path.join( os.path.expanduser('~'), '.cache', 'fbpic' ) )
+
+# Check if the environment variable FBPIC_USE_CUPY_WRAPPER is set to 0
+# and in that case, launch the kernels through numba instead of cupy
+# (see `compile_numba_cached` below)
+use_cupy_wrapper = True
+if 'FBPIC_USE_CUPY_WRAPPER' in os.environ:
+    if int(os.environ['FBPIC_USE_CUPY_WRAPPER']) == 0:
+        use_cupy_wrapper = False
+
 # -----------------------------------------------------
 # CUDA grid utilities
 # -----------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def get_gpu_model():
+    """
+    Infer if the current GPU is a P100 or V100 or other.
+
+    The GPU is only probed the first time that this function is called
+    (i.e. not when importing this module, and after the GPU of the
+    current MPI process has been selected), and the result is cached.
+
+    Returns :
+    ---------
+    cuda_gpu_model : str
+        Either "P100", "V100" or "other"
+    """
+    name = str( cuda.get_current_device().name )
+    if "P100" in name:
+        return( "P100" )
+    elif "V100" in name:
+        return( "V100" )
+    else:
+        return( "other" )
+
 def cuda_tpb_bpg_1d(x, TPB = 256):
     """
     Get the needed blocks per grid for a 1D CUDA grid.
@@ -50,6 +107,9 @@ def cuda_tpb_bpg_1d(x, TPB = 256):
 
     TPB : int
         Threads per block
+        (The same default is used for all GPU models, since no benchmark
+        supports a model-specific value. Kernels that are sensitive to
+        the block size pass their own value.)
 
     Returns :
     ---------
@@ -59,8 +119,9 @@ def cuda_tpb_bpg_1d(x, TPB = 256):
     TPB : int
         Threads per block.
     """
-    # Calculates the needed blocks per grid
-    BPG = int(x/TPB + 1)
+    # Calculates the needed blocks per grid (ceiling division, with
+    # at least one block, since CUDA does not accept empty grids)
+    BPG = max( int(-(-x // TPB)), 1 )
     return BPG, TPB
 
 def cuda_tpb_bpg_2d(x, y, TPBx = 1, TPBy = 128):
@@ -83,33 +144,69 @@ def cuda_tpb_bpg_2d(x, y, TPBx = 1, TPBy = 128):
     (TPBx, TPBy) : tuple of ints
         Threads per block in x and y.
     """
-    # Calculates the needed blocks per grid
-    BPGx = int(x/TPBx + 1)
-    BPGy = int(y/TPBy + 1)
+    # Calculates the needed blocks per grid (ceiling division, with
+    # at least one block, since CUDA does not accept empty grids)
+    BPGx = max( int(-(-x // TPBx)), 1 )
+    BPGy = max( int(-(-y // TPBy)), 1 )
     return (BPGx, BPGy), (TPBx, TPBy)
 
 # -----------------------------------------------------
 # CUDA memory management
 # -----------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def get_copy_stream( device_id ):
+    """
+    Return the CUDA stream that is shared by the transfers of all the
+    species and fields in `send_data_to_gpu` and `receive_data_from_gpu`.
+
+    The stream is non-blocking, i.e. it does not synchronize with the
+    default stream, on which the kernels are launched. It is created the
+    first time that this function is called (for each GPU).
+
+    Parameters :
+    ------------
+    device_id : int
+        The index of the current GPU
+
+    Returns :
+    ---------
+    A cupy.cuda.Stream object
+    """
+    return( cupy.cuda.Stream(non_blocking=True) )
+
 def send_data_to_gpu(simulation):
     """
     Send the simulation data to the GPU.
     Calls the functions of the particle and field package
     that send the data to the GPU.
 
+    The copies of all the species and fields are issued on a single
+    shared stream (see `get_copy_stream`), which is synchronized once
+    at the end.
+
     Parameters :
     ------------
     simulation : object
         A simulation object that contains the particle
         (ptcl) and field object (fld)
     """
+    stream = get_copy_stream( cupy.cuda.runtime.getDevice() )
+    # The GPU arrays are allocated on the current stream: make the
+    # copy stream wait for the work that is pending on this stream,
+    # since it may still use the memory that is reused by the pool
+    event = cupy.cuda.Event()
+    event.record( cupy.cuda.get_current_stream() )
+    stream.wait_event( event )
     # Send particles to the GPU (if CUDA is used)
     for species in simulation.ptcl :
         if species.use_cuda:
-            species.send_particles_to_gpu()
+            species.send_particles_to_gpu( stream=stream )
     # Send fields to the GPU (if CUDA is used)
-    simulation.fld.send_fields_to_gpu()
+    simulation.fld.send_fields_to_gpu( stream=stream )
+    # Wait for the copies to complete, since the kernels that
+    # use this data are launched on the default stream
+    stream.synchronize()
 
 def receive_data_from_gpu(simulation):
     """
@@ -117,23 +214,118 @@ def receive_data_from_gpu(simulation):
     Calls the functions of the particle and field package
     that receive the data from the GPU.
 
+    The copies of all the species and fields are issued on a single
+    shared stream (see `get_copy_stream`). This stream is synchronized
+    before returning, so that the CPU arrays can be used right away
+    (e.g. by diagnostics, or sent through MPI). Do not remove this
+    synchronization: a copy that is issued on a stream returns before
+    the data has actually arrived on the CPU.
+
     Parameters :
     ------------
     simulation : object
         A simulation object that contains the particle
         (ptcl) and field object (fld)
     """
+    stream = get_copy_stream( cupy.cuda.runtime.getDevice() )
+    # Wait for the kernels (launched on the default stream) to complete
+    cupy.cuda.runtime.deviceSynchronize()
     # Receive the particles from the GPU (if CUDA is used)
     for species in simulation.ptcl :
         if species.use_cuda:
-            species.receive_particles_from_gpu()
+            species.receive_particles_from_gpu( stream=stream )
     # Receive fields from the GPU (if CUDA is used)
-    simulation.fld.receive_fields_from_gpu()
+    simulation.fld.receive_fields_from_gpu( stream=stream )
+    # Wait for all the copies to complete
+    stream.synchronize()
+
+def send_array_to_gpu( array, host_buffers, key, stream=None ):
+    """
+    Copy a CPU array to the GPU, and keep a pagelocked copy of it
+    in `host_buffers`, to be reused by `receive_array_from_gpu`.
+
+    The pagelocked buffer is allocated only once (or when the shape
+    changes): once an array has been received back into this buffer,
+    sending it again does not require any allocation or copy on the CPU.
+
+    Parameters :
+    ------------
+    array : ndarray
+        The CPU array to be copied
+
+    host_buffers : dict
+        Dictionary of pagelocked CPU buffers (modified in-place)
+
+    key : str
+        The key of the buffer corresponding to `array`
+
+    stream : cupy.cuda.Stream, optional
+        The stream on which the copy is issued (asynchronously). When
+        passing a stream, the caller needs to synchronize it before the
+        GPU array can be used on another stream.
+
+    Returns :
+    ---------
+    The corresponding cupy array
+    """
+    buf = host_buffers.get( key )
+    if (buf is None) or (buf.shape != array.shape) \
+            or (buf.dtype != array.dtype):
+        buf = cuda.pinned_array( array.shape, dtype=array.dtype )
+        host_buffers[key] = buf
+    if buf is not array:
+        buf[...] = array
+    # (The GPU array is allocated on the current stream, so that the
+    # memory is returned to the default memory pool when it is freed.)
+    d_array = cupy.empty( buf.shape, dtype=buf.dtype )
+    d_array.set( buf, stream=stream )
+    return( d_array )
+
+def receive_array_from_gpu( d_array, host_buffers, key, stream=None ):
+    """
+    Copy a GPU array to the CPU, into the pagelocked buffer
+    of `host_buffers` that was registered by `send_array_to_gpu`.
+
+    Note that the returned array is this persistent buffer, which is
+    thus overwritten in place each time that the data is received from
+    the GPU: a reference to it (e.g. `sim.fld.interp[0].Ez`) is updated
+    by later transfers. Copy it, in order to keep the current values.
+
+    Parameters :
+    ------------
+    d_array : cupy array
+        The GPU array to be copied
+
+    host_buffers : dict
+        Dictionary of pagelocked CPU buffers
+
+    key : str
+        The key of the buffer corresponding to `d_array`
+
+    stream : cupy.cuda.Stream, optional
+        The stream on which the copy is issued (asynchronously). When
+        passing a stream, the caller needs to synchronize it before the
+        CPU array can be used.
+
+    Returns :
+    ---------
+    The corresponding CPU array
+    """
+    buf = host_buffers.get( key )
+    if (buf is None) or (buf.shape != d_array.shape) \
+            or (buf.dtype != d_array.dtype):
+        # No compatible buffer: allocate a new array
+        return( d_array.get( stream=stream ) )
+    d_array.get( stream=stream, out=buf )
+    return( buf )
 
 class GpuMemoryManager(object):
     """
     Context manager that temporarily moves the simulation data to the GPU,
     if the data is originally on the CPU when entering the context manager
+
+    As in `send_data_to_gpu` and `receive_data_from_gpu`, the transfers
+    are issued on the shared copy stream (see `get_copy_stream`).
     """
 
     def __init__(self, simulation):
@@ -146,34 +338,57 @@ class GpuMemoryManager(object):
             A simulation object that contains the particle
             (ptcl) and field object (fld)
         """
-        # Check whether the data is initially on the CPU or GPU
-        self.fields_were_on_gpu = simulation.fld.data_is_on_gpu
-        self.species_were_on_gpu = [ species.data_is_on_gpu \
-                                     for species in simulation.ptcl ]
         # Keep a reference to the simulation
         self.sim = simulation
+        # Check whether the data is initially on the CPU or GPU, and
+        # determine once and for all which objects need to be moved
+        self.move_fields = False
+        self.species_to_move = []
+        if simulation.use_cuda:
+            self.move_fields = not simulation.fld.data_is_on_gpu
+            self.species_to_move = [ species for species in simulation.ptcl \
+                                     if not species.data_is_on_gpu ]
+        self.move_data = self.move_fields or (len(self.species_to_move) > 0)
 
     def __enter__(self):
         """
         Move the data to the GPU (if it was originally on the CPU)
         """
-        if self.sim.use_cuda:
-            if not self.fields_were_on_gpu:
-                self.sim.fld.send_fields_to_gpu()
-            for i, species in enumerate(self.sim.ptcl):
-                if not self.species_were_on_gpu[i]:
-                    species.send_particles_to_gpu()
+        if not self.move_data:
+            return
+        stream = get_copy_stream( cupy.cuda.runtime.getDevice() )
+        # The GPU arrays are allocated on the current stream: make the
+        # copy stream wait for the work that is pending on this stream,
+        # since it may still use the memory that is reused by the pool
+        event = cupy.cuda.Event()
+        event.record( cupy.cuda.get_current_stream() )
+        stream.wait_event( event )
+        for species in self.species_to_move:
+            species.send_particles_to_gpu( stream=stream )
+        if self.move_fields:
+            self.sim.fld.send_fields_to_gpu( stream=stream )
+        # Wait for the transfers to complete, since the kernels that
+        # use this data are launched on the default stream
+        stream.synchronize()
 
     def __exit__(self, type, value, traceback):
         """
         Move the data back to the CPU (if it was originally on the CPU)
         """
-        if self.sim.use_cuda:
-            if not self.fields_were_on_gpu:
-                self.sim.fld.receive_fields_from_gpu()
-            for i, species in enumerate(self.sim.ptcl):
-                if not self.species_were_on_gpu[i]:
-                    species.receive_particles_from_gpu()
+        if not self.move_data:
+            return
+        stream = get_copy_stream( cupy.cuda.runtime.getDevice() )
+        # Wait for the kernels that were launched within the context
+        # (on the default stream) to complete
+        cupy.cuda.runtime.deviceSynchronize()
+        for species in self.species_to_move:
+            species.receive_particles_from_gpu( stream=stream )
+        if self.move_fields:
+            self.sim.fld.receive_fields_from_gpu( stream=stream )
+        # Wait for the transfers to complete, before the CPU
+        # arrays are used (e.g. by diagnostics, or sent through MPI).
+        # (Do not remove: the copies above are asynchronous.)
+        stream.synchronize()
 
 
 # -----------------------------------------------------
@@ -184,54 +399,313 @@ def mpi_select_gpus(mpi):
     """
     Selects the correct GPU used by the current MPI process
 
+    Each process selects its GPU (and thus creates its CUDA context) only
+    once. This needs to happen before any CUDA-aware MPI communication.
+
     Parameters :
     ------------
     mpi: an mpi4py.MPI object
     """
     n_gpus = len(cuda.gpus)
     rank = mpi.COMM_WORLD.rank
-    for i_gpu in range(n_gpus):
-        if rank%n_gpus == i_gpu:
-            cuda.select_device(i_gpu)
-        mpi.COMM_WORLD.barrier()
+    cuda.select_device( rank%n_gpus )
+    # Make sure that all processes have selected their GPU
+    mpi.COMM_WORLD.barrier()
+
+
+def get_nccl_communicator(mpi_comm):
+    """
+    Create a NCCL communicator, which includes the same processes (and
+    with the same ranks) as the MPI communicator `mpi_comm`, and which
+    can exchange CUDA GPU arrays directly between GPUs.
+
+    This needs to be called by all the processes of `mpi_comm`, after
+    their GPU has been selected (see `mpi_select_gpus`).
+
+    Parameters :
+    ------------
+    mpi_comm: an mpi4py communicator
+
+    Returns :
+    ---------
+    A cupy.cuda.nccl.NcclCommunicator object
+    """
+    from cupy.cuda import nccl
+    # Share the unique id of the communicator, created by the first process
+    if mpi_comm.rank == 0:
+        nccl_id = nccl.get_unique_id()
+    else:
+        nccl_id = None
+    nccl_id = mpi_comm.bcast( nccl_id, root=0 )
+    return( nccl.NcclCommunicator( mpi_comm.size, nccl_id, mpi_comm.rank ) )
 
 
 # -----------------------------------------------------
 # CUDA kernel decorator
 # -----------------------------------------------------
 
+def write_file_atomically( filename, data ):
+    """
+    Write the bytes `data` to `filename`, by first writing them to a
+    temporary file in the same directory, and then renaming it.
+
+    Parameters:
+    -----------
+    filename: string
+        The path of the file
+
+    data: bytes
+        The content of the file
+    """
+    fd, tmp_filename = tempfile.mkstemp( dir=os.path.dirname(filename) )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace( tmp_filename, filename )
+    except OSError:
+        os.remove( tmp_filename )
+        raise
+
+def get_called_device_functions( func ):
+    """
+    Return the python functions of the (numba-compiled) device functions
+    that are called by `func`, i.e. that are referenced by a global name
+    in `func`, or that are captured in its closure.
+
+    Parameters:
+    -----------
+    func: a python function
+
+    Returns:
+    --------
+    A list of python functions
+    """
+    candidates = [ func.__globals__[name] for name in func.__code__.co_names \
+                    if name in func.__globals__ ]
+    if func.__closure__ is not None:
+        for cell in func.__closure__:
+            try:
+                candidates.append( cell.cell_contents )
+            except ValueError:
+                # Empty cell
+                pass
+    # Numba dispatchers (e.g. from `cuda.jit(device=True)`)
+    # keep a reference to the original python function
+    return( [ obj.py_func for obj in candidates \
+                if inspect.isfunction( getattr(obj, 'py_func', None) ) ] )
+
+def get_kernel_source_hash( func ):
+    """
+    Return a hash of the source files that define the kernel `func` and
+    the device functions that it calls (recursively), so that a change in
+    any of these files invalidates the PTX code cached on disk.
+
+    Parameters:
+    -----------
+    func: a python function
+
+    Returns:
+    --------
+    A string, or None if a source file cannot be read
+    """
+    source_files = set()
+    visited = set()
+    functions_to_visit = [ func ]
+    while len(functions_to_visit) > 0:
+        f = functions_to_visit.pop()
+        if f in visited:
+            continue
+        visited.add(f)
+        try:
+            source_file = inspect.getsourcefile(f)
+        except TypeError:
+            return None
+        if source_file is None:
+            return None
+        source_files.add( source_file )
+        functions_to_visit += get_called_device_functions(f)
+
+    sha1 = hashlib.sha1()
+    for source_file in sorted( source_files ):
+        try:
+            with open(source_file, 'rb') as f:
+                sha1.update( f.read() )
+        except OSError:
+            return None
+    return( sha1.hexdigest() )
+
+@functools.lru_cache(maxsize=1)
+def get_cuda_toolchain_versions():
+    """
+    Return the versions of the CUDA runtime and of NVVM, which produce
+    the PTX code of the kernels, so that the PTX code cached on disk is
+    invalidated when the CUDA toolkit changes.
+
+    The versions are only queried the first time that this function is
+    called, and the result is cached.
+
+    Returns:
+    --------
+    A tuple (runtime_version, nvvm_version), where each element is None
+    if the corresponding version cannot be determined
+    """
+    try:
+        runtime_version = cuda.runtime.get_version()
+    except Exception:
+        runtime_version = None
+    try:
+        from numba.cuda.cudadrv.nvvm import NVVM
+        nvvm_version = NVVM().get_version()
+    except Exception:
+        nvvm_version = None
+    return( runtime_version, nvvm_version )
+
+def read_cached_ptx( ptx_file ):
+    """
+    Read the PTX code and the name of a kernel from the disk cache.
+
+    Parameters:
+    -----------
+    ptx_file: string
+        The path of the cached PTX code (see `compile_cupy`), next to which
+        the name of the kernel is stored, in a `.json` file
+
+    Returns:
+    --------
+    A tuple (ptx, kernel_name), or None if the cache entry is missing
+    or cannot be read
+    """
+    name_file = ptx_file[:-4] + '.json'
+    try:
+        with open(name_file) as f:
+            kernel_name = json.load(f)['entry_name']
+        with open(ptx_file, 'rb') as f:
+            ptx = f.read()
+    except (OSError, ValueError, KeyError):
+        return None
+    return( ptx, kernel_name )
+
+def write_cached_ptx( ptx_file, ptx, kernel_name ):
+    """
+    Write the PTX code and the name of a kernel to the disk cache.
+
+    The name of the kernel is written first, and each file is written
+    atomically, so that other processes never read an incomplete entry.
+    (Errors are ignored, since the cache is only an optimization.)
+
+    Parameters:
+    -----------
+    ptx_file: string
+        The path of the cached PTX code
+
+    ptx: bytes
+        The PTX code
+
+    kernel_name: string
+        The name of the kernel, in the PTX code
+    """
+    name_file = ptx_file[:-4] + '.json'
+    try:
+        os.makedirs( os.path.dirname(ptx_file), exist_ok=True )
+        write_file_atomically( name_file,
+                json.dumps({'entry_name': kernel_name}).encode() )
+        write_file_atomically( ptx_file, ptx )
+    except OSError:
+        pass
+
 if cuda_installed:
 
-    def get_args_hash(args):
+    def get_kernel_args_layout(arg_types):
         """
-        Computes a hash from the argument types of a kernel call.
-        This takes into account the data types as well as (for arrays) the
-        number of dimensions.
+        Compute the position of each argument in the list of arguments
+        that is passed to the Cupy kernel.
+
+        Because of the way Numba JIT compilation works, each array is passed
+        as 5 + 2*ndim kernel arguments (two null pointers, the size, the
+        itemsize, the array itself, its shape and its strides), while each
+        scalar is passed as a single kernel argument.
 
         Parameters:
         -----------
-        args: A list of arguments (scalars or Cupy arrays).
+        arg_types: tuple
+            The argument types, as built by `call_kernel`, i.e.
+            (dtype number, ndim) for arrays, and the type for scalars
 
         Returns:
         --------
-        hash: Hash value as an int.
+        n_kernel_args: int
+            The total number of kernel arguments
+
+        layout: tuple
+            One (start, stop) pair per argument. For arrays, this is the
+            slice of the kernel arguments that follow the two null
+            pointers (i.e. size, itemsize, array, shape and strides).
+            For scalars, `start` is the position of the kernel argument,
+            and `stop` is None.
         """
-        types = []
+        layout = []
+        n_kernel_args = 0
+        for arg_type in arg_types:
+            if isinstance(arg_type, tuple):
+                ndim = arg_type[1]
+                layout.append( (n_kernel_args+2, n_kernel_args+5+2*ndim) )
+                n_kernel_args += 5 + 2*ndim
+            else:
+                layout.append( (n_kernel_args, None) )
+                n_kernel_args += 1
+        return( n_kernel_args, tuple(layout) )
 
-        # Loop over the arguments
-        for a in args:
-            # For array arguments: save the data type and the number of
-            # dimensions
-            if isinstance(a, cupy.ndarray):
-                types.append(a.dtype)
-                types.append(a.ndim)
+    class compile_numba_cached(object):
+        """
+        Alternative to `compile_cupy`, which compiles and launches the
+        kernels directly with `numba.cuda.jit`, using numba's on-disk cache.
+
+        Numba accepts the Cupy arrays directly (through the CUDA array
+        interface), so that the arguments do not need to be marshalled as in
+        `compile_cupy`, but the launch overhead of numba is higher. When the
+        environment variable FBPIC_USE_CUPY_WRAPPER is set to 0,
+        `compile_cupy` returns an instance of this class instead, for all
+        the kernels of fbpic, so that both can be benchmarked.
+        """
 
-            # For scalar arguments: save only the data type
-            else:
-                types.append(np.dtype(type(a)))
+        def __init__(self, func):
+            """
+            Constructor of the decorator class.
 
-        # Use the built-in Python hash function to compute the hash
-        return hash(tuple(types))
+            Parameters:
+            -----------
+            func: The python function the decorator is applied to, which will
+                be compiled into a CUDA kernel.
+            """
+            self.python_func = func
+            self.numba_kernel = cuda.jit( cache=caching )( func )
+
+        def specialize(self, signature):
+            """
+            Specialize a kernel for an explicit function signature. The kernel
+            is then compiled immediately.
+
+            Parameters:
+            -----------
+            signature: The signature of the kernel, in numba format.
+            """
+            self.numba_kernel = cuda.jit( signature,
+                                          cache=caching )( self.python_func )
+            return self
+
+        def __getitem__(self, bt):
+            """
+            Called when the kernel is called with square brackets, e.g.
+            ```
+            kernel[blocks_per_grid, threads_per_block]( *args )
+            ```
+
+            Parameters:
+            -----------
+            bt: A 2-tuple (blocks_per_grid, threads_per_block) giving the
+                thread and block size on the GPU.
+            """
+            return self.numba_kernel[bt]
 
     class compile_cupy(object):
         """
@@ -254,6 +728,15 @@ if cuda_installed:
         argument types.
         """
 
+        def __new__(cls, func):
+            """
+            Return a `compile_numba_cached` object instead, when the
+            environment variable FBPIC_USE_CUPY_WRAPPER is set to 0.
+            """
+            if not use_cupy_wrapper:
+                return compile_numba_cached( func )
+            return object.__new__(cls)
+
         def __init__(self, func):
             """
             Constructor of the decorator class.
@@ -265,11 +748,20 @@ if cuda_installed:
             """
 
             self.python_func = func
-            self.kernel_dict = {} # Stores compiled kernels to avoid re-compilation
+            # Stores compiled kernels (and the layout of their arguments)
+            # to avoid re-compilation
+            self.kernel_dict = {}
 
             # Flag to save whether the kernel has been explicitly specialized
             self.is_specialized = False
 
+            # Stores the launch wrappers returned by `__getitem__`, so that
+            # they are not re-created at each launch. (This is bounded,
+            # since the number of blocks typically changes with the
+            # number of particles.)
+            self.get_launcher = functools.lru_cache(maxsize=128)(
+                                                    self.make_launcher )
+
         def specialize(self, signature):
             """
             Specialize a kernel for an explicit function signature. The kernel
@@ -287,24 +779,126 @@ if cuda_installed:
             # Create a Cupy kernel module and load the PTX code of the
             # numba kernel
             module = cupy.cuda.function.Module()
-            module.load(bytes(numba_kernel.ptx, 'UTF-8'))
+            # (PTX code is plain ASCII)
+            module.load(numba_kernel.ptx.encode('ascii'))
 
             # Save the resulting Cupy kernel
+            # (together with the GPU on which it was loaded)
             if numba_minor_version > 50:
                 kernel_name = numba_kernel.definition.entry_name
             else:
                 kernel_name = numba_kernel.entry_name
             self.specialized_kernel = module.get_function( kernel_name )
+            self.specialized_device = cupy.cuda.runtime.getDevice()
+            self.signature = signature
             self.is_specialized = True
 
             return self
 
+        def get_ptx_cache_file(self, args):
+            """
+            Return the path of the file in which the PTX code of the kernel,
+            compiled for the types of `args`, is cached on disk.
+
+            The name of the file is a hash of the source code of the modules
+            that define the kernel and the device functions that it calls
+            (see `get_kernel_source_hash`), of the argument types, of the
+            versions of fbpic, numba, the CUDA runtime and NVVM (see
+            `get_cuda_toolchain_versions`), and of the compute capability
+            of the GPU.
+
+            Parameters:
+            -----------
+            args: List of the kernel arguments.
+
+            Returns:
+            --------
+            A string, or None if the kernel cannot be cached.
+            """
+            if ptx_cache_dir is None:
+                return None
+            source_hash = get_kernel_source_hash( self.python_func )
+            if source_hash is None:
+                return None
+            # Argument types: data type and number of dimensions for arrays,
+            # and type name for scalars
+            arg_types = [ (a.dtype.str, a.ndim) \
+                if isinstance(a, cupy.ndarray) else type(a).__name__ \
+                for a in args ]
+            key = repr(( source_hash, self.python_func.__qualname__,
+                        arg_types, fbpic_version, numba.__version__,
+                        get_cuda_toolchain_versions(),
+                        cuda.get_current_device().compute_capability ))
+            sha1 = hashlib.sha1( key.encode('UTF-8') ).hexdigest()
+            return os.path.join( ptx_cache_dir, sha1 + '.ptx' )
+
+        def compile_kernel(self, args):
+            """
+            Compile the kernel for the types of `args`, and return the
+            corresponding Cupy kernel.
+
+            The PTX code is read from the disk cache if it is available
+            there (and if it can be loaded by the driver). Otherwise, it is
+            produced by `numba.cuda.jit`, and written to the disk cache.
+
+            Parameters:
+            -----------
+            args: List of the kernel arguments.
+            """
+            ptx_file = self.get_ptx_cache_file(args)
+            cached_ptx = None
+            if ptx_file is not None:
+                cached_ptx = read_cached_ptx( ptx_file )
+
+            if cached_ptx is not None:
+                ptx, kernel_name = cached_ptx
+                # Create a Cupy kernel module and load the cached PTX code
+                module = cupy.cuda.function.Module()
+                try:
+                    module.load(ptx)
+                    return module.get_function( kernel_name )
+                except cupy.cuda.driver.CUDADriverError:
+                    # The cached PTX code is invalid (e.g. it was produced
+                    # for another driver): recompile it below, and
+                    # overwrite the cache entry
+                    pass
+
+            # Compile a Numba kernel for the specified arguments
+            # using cuda.jit
+            numba_kernel = cuda.jit()(self.python_func).specialize(*args)
+            if numba_minor_version > 50:
+                kernel_name = numba_kernel.definition.entry_name
+            else:
+                kernel_name = numba_kernel.entry_name
+            # (PTX code is plain ASCII)
+            ptx = numba_kernel.ptx.encode('ascii')
+            # Write the PTX code to the disk cache
+            if ptx_file is not None:
+                write_cached_ptx( ptx_file, ptx, kernel_name )
+
+            # Create a Cupy kernel module and load the PTX code
+            module = cupy.cuda.function.Module()
+            module.load(ptx)
+            return module.get_function( kernel_name )
+
         def __getitem__(self, bt):
             """
             Called when the kernel is called with square brackets, e.g.
             ```
             kernel[blocks_per_grid, threads_per_block]( *args )
             ```
+            and return the corresponding wrapper function (see
+            `make_launcher`), which is reused for identical `bt`.
+            """
+            return self.get_launcher(bt)
+
+        def make_launcher(self, bt):
+            """
+            Create the wrapper function that launches the kernel for a
+            given thread and block size, when it is called e.g. as
+            ```
+            kernel[blocks_per_grid, threads_per_block]( *args )
+            ```
             This is used to mimic the Numba launch syntax.
 
             Parameters:
@@ -345,67 +939,60 @@ if cuda_installed:
                     complex, bool) or Cupy arrays.
                 """
 
-                # For explicitly specialized, do not worry about the argument types
-                if self.is_specialized:
-                    kernel = self.specialized_kernel
-
-                else:
-                    # Calculate a hash from the argument types to check whether a
-                    # compatible kernel is already compiled.
-                    hash = get_args_hash(args)
-
-                    if hash not in self.kernel_dict:
-
-                        # Compile a Numba kernel for the specified arguments
-                        # using cuda.jit
-                        numba_kernel = cuda.jit()(self.python_func) \
-                            .specialize(*args)
-
-                        # Create a Cupy kernel module and load the PTX code of the
-                        # numba kernel
-                        module = cupy.cuda.function.Module()
-                        module.load(bytes(numba_kernel.ptx, 'UTF-8'))
-
-                        # Cache the resulting Cupy kernel in a dictionary using
-                        # the hash
-                        if numba_minor_version > 50:
-                            kernel_name = numba_kernel.definition.entry_name
-                        else:
-                            kernel_name = numba_kernel.entry_name
-                        self.kernel_dict[hash] = module.get_function( kernel_name )
-
-                    # Get the correct kernel from the cache
-                    kernel = self.kernel_dict[hash]
+                # Build a key from the argument types to check whether a
+                # compatible kernel is already compiled. This takes into
+                # account the data types as well as (for arrays) the
+                # number of dimensions. (The key is built inline, as a
+                # tuple, since this is done at every kernel launch.)
+                arg_types = tuple( (a.dtype.num, a.ndim) \
+                    if isinstance(a, cupy.ndarray) else type(a) \
+                    for a in args )
+                # The key also contains the current GPU, since a kernel
+                # can only be launched on the GPU on which it was loaded
+                key = (cupy.cuda.runtime.getDevice(), arg_types)
+
+                # (The kernels are looked up by equality of the keys, so that
+                # different argument types can never share a kernel.)
+                try:
+                    cached = self.kernel_dict[key]
+                except KeyError:
+                    # For explicitly specialized kernels, do not worry
+                    # about the argument types
+                    if self.is_specialized:
+                        if self.specialized_device != key[0]:
+                            self.specialize( self.signature )
+                        kernel = self.specialized_kernel
+                    else:
+                        # Compile the kernel (or load it from the disk cache)
+                        kernel = self.compile_kernel(args)
+                    # Cache the resulting Cupy kernel in a dictionary using
+                    # the key, together with the layout of its arguments
+                    cached = (kernel,) + get_kernel_args_layout(arg_types)
+                    self.kernel_dict[key] = cached
+                kernel, n_kernel_args, layout = cached
 
                 # Prepare the arguments for the Cupy kernel.
                 # Because of the way Numba JIT compilation works, the
                 # resulting kernels expect multiple arguments for each array.
-                kernel_args = []
-
-                # Loop over the given arguments
-                for a in args:
-
-                    # Check whether the argument is an array and requires
-                    # multiple kernel arguments.
-                    if isinstance(a, cupy.ndarray):
-                        # Append all required arguments to the list, in order:
-                        # - Two zeroes (corresponding to null pointers in C)
+                # (The list is allocated with its final size, and the
+                # two first entries of each array, which correspond to null
+                # pointers in C, are thus already set to 0.)
+                kernel_args = [0] * n_kernel_args
+                for a, (start, stop) in zip(args, layout):
+                    if stop is None:
+                        # For scalar arguments, simply set the
+                        # argument itself.
+                        kernel_args[start] = a
+                    else:
+                        # For arrays, set (after the two null pointers),
+                        # with a single slice assignment:
                         # - The total size of the array
                         # - The size in bytes of the array datatype
                         # - The array itself
                         # - The shape of the array, as single integers
                         # - The strides of the array, as single integers
-                        # Note that due to the latter two entries, the actual
-                        # number of arguments per array depends on the number
-                        # of array dimensions.
-                        kernel_args.extend(
-                            [0, 0, a.size, a.dtype.itemsize, a])
-                        kernel_args.extend(a.shape)
-                        kernel_args.extend(a.strides)
-                    else:
-                        # For scalar arguments, simply append the
-                        # argument itself.
-                        kernel_args.append(a)
+                        kernel_args[start:stop] = \
+                            (a.size, a.itemsize, a) + a.shape + a.strides
 
                 # Call the actual kernel.
                 # The arguments of the call are:
@@ -414,5 +1001,5 @@ if cuda_installed:
                 # - The prepared list of kernel arguments
                 kernel (blocks_per_grid, threads_per_block, kernel_args)
 
-            # __getitem__ returns the created wrapper method.
+            # Return the created wrapper method.
             return call_kernel
@@ -32,6 +32,17 @@ try:
     else:
         gpudirect_enabled = False
 
+    # Check if the environment variable FBPIC_ENABLE_NCCL is set to 1
+    # and in that case, exchange the guard cells of the CUDA GPU arrays
+    # directly between GPUs with NCCL (instead of MPI)
+    if 'FBPIC_ENABLE_NCCL' in os.environ:
+        if int(os.environ['FBPIC_ENABLE_NCCL']) == 1:
+            nccl_enabled = True
+        else:
+            nccl_enabled = False
+    else:
+        nccl_enabled = False
+
     if gpudirect_enabled:
         mpi4py_version_number = mpi4py.__version__.split('.')
         mpi4py_major_version = int(mpi4py_version_number[0])
@@ -70,3 +81,4 @@ except ImportError:
     mpi_type_dict = {}
     mpi_installed = False
     gpudirect_enabled = False
+    nccl_enabled = False
@@ -8,7 +8,8 @@ It defines a set of generic functions for printing simulation information.
 import sys, time
 from fbpic import __version__
 from fbpic.utils.cuda import cuda, cuda_installed
-from fbpic.utils.mpi import MPI, mpi_installed, gpudirect_enabled
+from fbpic.utils.mpi import MPI, mpi_installed, gpudirect_enabled, \
+    nccl_enabled
 # Check if terminal is correctly set to UTF-8 and set progress character
 if sys.stdout.encoding == 'UTF-8':
     progress_char = u'\u2588'
@@ -22,10 +23,12 @@ class ProgressBar(object):
     summary of the total runtime.
     """
 
-    def __init__(self, N, n_avg=20, Nbars=35, char=progress_char):
+    def __init__(self, N, n_avg=20, Nbars=35, char=progress_char,
+                    update_period=0.1):
         """
         Initializes a timer / progression bar.
-        Timing is done with respect to the absolute time at initialization.
+        Timing is done with respect to the time at initialization
+        (using a monotonic clock, unaffected by system clock updates).
 
         Parameters
         ----------
@@ -41,16 +44,22 @@ class ProgressBar(object):
 
         char: str, optional
             The character used to show the progression.
+
+        update_period: float, optional
+            The minimal time (in seconds) between two successive
+            printings of the progression bar
         """
         self.N = N
         self.n_avg = n_avg
         self.Nbars = Nbars
         self.bar_char = char
+        self.update_period = update_period
 
         # Initialize variables to measure the time taken by the simulation
         self.i_step = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.prev_time = self.start_time
+        self.last_print_time = self.start_time
         self.total_duration = 0.
         self.time_per_step = 0.
         self.avg_time_per_step = 0.
@@ -70,7 +79,7 @@ class ProgressBar(object):
         # Register current step
         self.i_step = i_step
         # Calculate time taken by last step
-        curr_time = time.time()
+        curr_time = time.monotonic()
         self.total_duration = curr_time - self.start_time
         self.time_per_step = curr_time - self.prev_time
         # Estimate average time per step
@@ -91,33 +100,41 @@ class ProgressBar(object):
         """
         Prints a progression bar with the estimated
         remaining simulation time and the time taken by the last step.
+
+        In order to avoid blocking on terminal I/O at every step, the bar
+        is only printed if `update_period` has elapsed since it was last
+        printed (and always at the first and last step).
         """
         i = self.i_step
+        # Skip the printing if the bar was updated recently
+        if (0 < i < self.N-1) and \
+            (self.prev_time - self.last_print_time < self.update_period):
+            return
+        self.last_print_time = self.prev_time
         # Print progress bar
         if i == 0:
             # Let the user know that the first step is much longer
-            sys.stdout.write('\r' + \
-                'Just-In-Time compilation (up to one minute) ...')
-            sys.stdout.flush()
+            line = '\r' + 'Just-In-Time compilation (up to one minute) ...'
         else:
             # Print the progression bar
             nbars = int( (i+1)*1./self.N*self.Nbars )
-            sys.stdout.write('\r|' + nbars*self.bar_char )
-            sys.stdout.write((self.Nbars-nbars)*' ')
-            sys.stdout.write('| %d/%d' %(i+1,self.N))
+            line = '\r|' + nbars*self.bar_char + (self.Nbars-nbars)*' '
+            line += '| %d/%d' %(i+1,self.N)
             if self.eta is None:
                 # Time estimation is only printed after n_avg timesteps
-                sys.stdout.write(', calc. ETA...')
+                line += ', calc. ETA...'
             else:
                 # Conversion to H:M:S
                 m, s = divmod(self.eta, 60)
                 h, m = divmod(m, 60)
-                sys.stdout.write(', %d:%02d:%02d left' % (h, m, s))
+                line += ', %d:%02d:%02d left' % (h, m, s)
             # Time taken by the last step
-            sys.stdout.write(', %d ms/step' %(self.time_per_step*1.e3))
-            sys.stdout.flush()
+            line += ', %d ms/step' %(self.time_per_step*1.e3)
         # Clear line
-        sys.stdout.write('\033[K')
+        line += '\033[K'
+        # Write the whole line at once
+        sys.stdout.write( line )
+        sys.stdout.flush()
 
     def print_summary( self ):
         """
@@ -191,6 +208,10 @@ def print_simulation_setup( sim, verbose_level=1 ):
                         message += '\nCUDA GPUDirect (MPI) enabled: Yes'
                     else:
                         message += '\nCUDA GPUDirect (MPI) enabled: No'
+                    if nccl_enabled:
+                        message += '\nNCCL enabled: Yes'
+                    else:
+                        message += '\nNCCL enabled: No'
                 node_message = get_gpu_message()
             else:
                 message += '\nCompute architecture: CPU'
@@ -0,0 +1,110 @@
+# Copyright 2020, FBPIC contributors
+# License: 3-Clause-BSD-LBNL
+"""
+This test file is part of FB-PIC (Fourier-Bessel Particle-In-Cell).
+
+It tests the function `adapt_to_grid` (which adapts the bounds of the
+plasma to the grid, when adding a new species), by comparing it to a
+reference implementation that selects the gridpoints with a mask
+(i.e. the former implementation of `adapt_to_grid`) for:
+- random bounds
+- bounds that fall on the edges of the cells
+- a non-zero number of empty cells at the righthand side of the box
+
+Usage :
+from the top-level directory of FBPIC run
+$ python tests/test_adapt_to_grid.py
+or
+$ py.test -q tests/test_adapt_to_grid.py
+"""
+import numpy as np
+from fbpic.main import adapt_to_grid
+
+# Parameters of the grid
+zmin = -10.e-6
+dz = 0.04e-6
+Nz = 500
+p_nz = 2
+
+def adapt_to_grid_mask( x, p_xmin, p_xmax, p_nx, ncells_empty=0 ):
+    """
+    Reference implementation of `adapt_to_grid`, which takes the
+    array of the positions of the gridpoints `x`
+    """
+    # Find the max and the step of the array
+    xmin = x.min()
+    xmax = x.max()
+    dx = x[1] - x[0]
+
+    # Do not load particles below the lower bound of the box
+    if p_xmin < xmin - 0.5*dx:
+        p_xmin = xmin - 0.5*dx
+    # Do not load particles in the two last upper cells
+    if p_xmax > xmax + (0.5-ncells_empty)*dx:
+        p_xmax = xmax + (0.5-ncells_empty)*dx
+
+    # Find the gridpoints on which the particles should be loaded
+    x_load = x[ ( x > p_xmin ) & ( x < p_xmax ) ]
+    # Deduce the total number of particles
+    Npx = len(x_load) * p_nx
+    # Reajust p_xmin and p_xmanx so that they match the grid
+    if Npx > 0:
+        p_xmin = x_load.min() - 0.5*dx
+        p_xmax = x_load.max() + 0.5*dx
+
+    return( p_xmin, p_xmax, Npx )
+
+def compare_with_mask( p_zmin, p_zmax, ncells_empty=0 ):
+    """
+    Check that `adapt_to_grid` and `adapt_to_grid_mask` give the
+    same bounds and number of particles
+    """
+    # Positions of the gridpoints (at the center of the cells)
+    z = zmin + (0.5 + np.arange(Nz))*dz
+    p_zmin_ref, p_zmax_ref, Npz_ref = adapt_to_grid_mask(
+        z, p_zmin, p_zmax, p_nz, ncells_empty )
+    p_zmin_new, p_zmax_new, Npz_new = adapt_to_grid(
+        zmin + 0.5*dz, dz, Nz, p_zmin, p_zmax, p_nz, ncells_empty )
+
+    assert Npz_new == Npz_ref
+    # (When no particle is loaded, the bounds are not used)
+    if Npz_ref > 0:
+        assert np.isclose( p_zmin_new, p_zmin_ref, rtol=0, atol=1.e-9*dz )
+        assert np.isclose( p_zmax_new, p_zmax_ref, rtol=0, atol=1.e-9*dz )
+
+def test_adapt_to_grid_random_bounds():
+    "Function that is run by py.test, when doing `python setup.py test`"
+    np.random.seed(0)
+    zmax = zmin + Nz*dz
+    for i in range(1000):
+        # (Some of the bounds are outside of the box)
+        p_zmin, p_zmax = np.sort( np.random.uniform(
+            zmin - 20*dz, zmax + 20*dz, 2 ) )
+        compare_with_mask( p_zmin, p_zmax )
+
+def test_adapt_to_grid_cell_edges():
+    "Function that is run by py.test, when doing `python setup.py test`"
+    # Bounds on the edges of the cells, including the edges of the box
+    for i_min in [ 0, 1, 17, Nz-2 ]:
+        for i_max in [ i_min, i_min+1, i_min+5, Nz ]:
+            compare_with_mask( zmin + i_min*dz, zmin + i_max*dz )
+
+def test_adapt_to_grid_empty_cells():
+    "Function that is run by py.test, when doing `python setup.py test`"
+    np.random.seed(0)
+    zmax = zmin + Nz*dz
+    for ncells_empty in [ 1, 2, 10 ]:
+        # Bounds that extend beyond the end of the box
+        compare_with_mask( zmin, zmax + dz, ncells_empty )
+        compare_with_mask( zmin + 3*dz, zmax, ncells_empty )
+        # Random bounds
+        for i in range(100):
+            p_zmin, p_zmax = np.sort( np.random.uniform(
+                zmin - 20*dz, zmax + 20*dz, 2 ) )
+            compare_with_mask( p_zmin, p_zmax, ncells_empty )
+
+if __name__ == '__main__' :
+
+    test_adapt_to_grid_random_bounds()
+    test_adapt_to_grid_cell_edges()
+    test_adapt_to_grid_empty_cells()
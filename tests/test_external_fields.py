@@ -45,7 +45,8 @@ p_nr = 1
 p_nz = 1
 n = 1.
 
-def run_external_laser_field_simulation(show, gamma_boost=None):
+def run_external_laser_field_simulation(show, gamma_boost=None,
+                                        particle_field_dtype=np.float64):
     """
     Runs a simulation with a set of particles whose motion corresponds
     to that of a particle that is initially at rest (in the lab frame)
@@ -76,11 +77,12 @@ def run_external_laser_field_simulation(show, gamma_boost=None):
     sim = Simulation( Nz, zmax, Nr, rmax, Nm, dt,
         initialize_ions=False, zmin=zmin,
         use_cuda=use_cuda, boundaries='periodic',
-        gamma_boost=gamma_boost )
+        gamma_boost=gamma_boost, particle_field_dtype=particle_field_dtype )
     # Add electrons
     sim.ptcl = []
     sim.add_new_species( -e, m_e, n=n, p_rmax=p_rmax,
                           p_nz=p_nz, p_nr=p_nr, p_nt=p_nt )
+    assert sim.ptcl[0].Ex.dtype == particle_field_dtype
 
     # Add the external fields
     sim.external_fields = [
@@ -164,7 +166,13 @@ def test_external_fields_boost(show=False):
     "Function that is run by py.test, when doing `python setup.py test`"
     run_external_laser_field_simulation( show, gamma_boost=10 )
 
+def test_external_fields_single_precision(show=False):
+    "Function that is run by py.test, when doing `python setup.py test`"
+    run_external_laser_field_simulation( show, None,
+                                        particle_field_dtype=np.float32 )
+
 if __name__ == '__main__' :
 
     test_external_fields_lab( show )
     test_external_fields_boost( show )
+    test_external_fields_single_precision( show )
@@ -0,0 +1,110 @@
+# Copyright 2020, FBPIC contributors
+# License: 3-Clause-BSD-LBNL
+"""
+This test file is part of FB-PIC (Fourier-Bessel Particle-In-Cell).
+
+It tests the exchange of the guard cells of E and B between MPI domains,
+when E and B are exchanged together (`exchange_fields(interp, 'EB',
+'replace')`, with a single message per neighbor). In a periodic box that
+is split between 2 MPI ranks, each field is initialized to a known
+function of the global z index, and the guard cells are first filled
+with invalid values. After the exchange, all the cells (including the
+guard cells) should contain the known function, and the result should
+be identical to that of separate exchanges of E and B.
+
+Usage :
+from the top-level directory of FBPIC run
+$ py.test -q tests/test_field_exchange.py
+(which runs this script with `mpirun -np 2`) or directly
+$ mpirun -np 2 python tests/test_field_exchange.py
+"""
+import os
+import sys
+import copy
+import shutil
+import subprocess
+import pytest
+import numpy as np
+from scipy.constants import c
+from fbpic.main import Simulation
+
+# Parameters of the simulation (periodic box, without particles)
+Nz = 200
+zmax = 20.e-6
+Nr = 16
+rmax = 10.e-6
+Nm = 2
+n_order = 8
+dt = zmax/Nz/c
+
+field_names = [ 'Er', 'Et', 'Ez', 'Br', 'Bt', 'Bz' ]
+
+def known_field( iz_global, m, i_field ):
+    """
+    Return the value of the field `field_names[i_field]` of mode `m`
+    at the global z index `iz_global` (1darray), as a 2darray (Nz, Nr)
+    """
+    iz_global = iz_global % Nz
+    return( (iz_global + 1.j*(m + 10*i_field))[:, np.newaxis] \
+                * (1. + np.arange(Nr))[np.newaxis, :] )
+
+def check_EB_exchange():
+    """
+    Initialize the fields, exchange E and B and check the guard cells
+    (This function should be run with 2 MPI ranks.)
+    """
+    sim = Simulation( Nz, zmax, Nr, rmax, Nm, dt, zmin=0., n_order=n_order,
+                      boundaries={'z':'periodic', 'r':'reflective'},
+                      use_cuda=False, verbose_level=0 )
+    sim.ptcl = []
+    comm = sim.comm
+    assert comm.size == 2
+
+    # Global z index of the cells of the local domain (with guard cells)
+    Nz_local, iz_start = comm.get_Nz_and_iz( local=True, with_damp=True,
+                                            with_guard=True, rank=comm.rank )
+    iz_global = iz_start + np.arange( Nz_local )
+    # Cells of the physical domain (i.e. excluding the guard cells)
+    ng = comm.n_guard
+    physical = slice( ng, Nz_local - ng )
+
+    # Fill the physical domain with the known fields,
+    # and the guard cells with invalid values
+    for m in range(Nm):
+        for i_field, name in enumerate(field_names):
+            field = getattr( sim.fld.interp[m], name )
+            field[:,:] = np.nan
+            field[physical,:] = known_field( iz_global, m, i_field )[physical]
+    # Keep a copy, for the separate exchanges of E and B
+    interp_separate = copy.deepcopy( sim.fld.interp )
+
+    # Exchange E and B together, and check all the cells
+    comm.exchange_fields( sim.fld.interp, 'EB', 'replace' )
+    for m in range(Nm):
+        for i_field, name in enumerate(field_names):
+            field = getattr( sim.fld.interp[m], name )
+            assert np.array_equal( field, known_field( iz_global, m, i_field ) )
+
+    # Exchange E and B separately, and check that the result is identical
+    comm.exchange_fields( interp_separate, 'E', 'replace' )
+    comm.exchange_fields( interp_separate, 'B', 'replace' )
+    for m in range(Nm):
+        for name in field_names:
+            assert np.array_equal( getattr( interp_separate[m], name ),
+                                   getattr( sim.fld.interp[m], name ) )
+
+def test_EB_exchange():
+    "Function that is run by py.test, when doing `python setup.py test`"
+    if shutil.which('mpirun') is None:
+        pytest.skip('mpirun is not available')
+    pytest.importorskip('mpi4py')
+    # Make sure that the MPI processes import this version of fbpic
+    repo_root = os.path.dirname( os.path.dirname(os.path.abspath(__file__)) )
+    env = dict( os.environ, PYTHONPATH=repo_root )
+    response = subprocess.call( [ 'mpirun', '-np', '2', sys.executable,
+                                  os.path.abspath(__file__) ], env=env )
+    assert response == 0
+
+if __name__ == '__main__' :
+
+    check_EB_exchange()
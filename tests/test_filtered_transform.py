@@ -0,0 +1,84 @@
+# Copyright 2020, FBPIC contributors
+# License: 3-Clause-BSD-LBNL
+"""
+This test file is part of FB-PIC (Fourier-Bessel Particle-In-Cell).
+
+It tests the transforms of the charge and current densities to spectral
+space in which the spectral filter is applied at the same time (i.e.
+`Fields.interp2spect(fieldtype, filtered=True)`, and the argument
+`filter_arrays` of `DHT.transform`), by comparing them with the
+unfiltered transforms followed by a separate filtering step.
+
+Usage :
+from the top-level directory of FBPIC run
+$ python tests/test_filtered_transform.py
+or
+$ py.test -q tests/test_filtered_transform.py
+"""
+import numpy as np
+from fbpic.fields import Fields
+from fbpic.fields.spectral_transform.hankel import DHT
+
+# Parameters of the grid
+Nz = 64
+zmax = 20.e-6
+Nr = 32
+rmax = 10.e-6
+Nm = 2
+dt = 0.01e-6/3.e8
+
+def random_complex_array( shape ):
+    "Return an array of random complex values"
+    return( np.random.rand(*shape) + 1.j*np.random.rand(*shape) )
+
+def test_dht_filter_arrays():
+    "Function that is run by py.test, when doing `python setup.py test`"
+    np.random.seed(0)
+    # Arbitrary filter, in z and r
+    filter_array_z = np.random.rand( Nz )
+    filter_array_r = np.random.rand( Nr )
+    for m in range(Nm):
+        for p in [ m-1, m, m+1 ]:
+            dht = DHT( p, m, Nr, Nz, rmax )
+            F = random_complex_array( (Nz, Nr) )
+            # Unfiltered transform, followed by the filter
+            G_ref = np.empty( (Nz, Nr), dtype=np.complex128 )
+            dht.transform( F, G_ref )
+            G_ref *= filter_array_z[:,np.newaxis] * filter_array_r[np.newaxis,:]
+            # Filtered transform
+            G = np.empty( (Nz, Nr), dtype=np.complex128 )
+            dht.transform( F, G, (filter_array_z, filter_array_r) )
+            assert np.allclose( G, G_ref, rtol=1.e-14, atol=0 )
+
+def test_filtered_interp2spect():
+    "Function that is run by py.test, when doing `python setup.py test`"
+    np.random.seed(0)
+    fld = Fields( Nz, zmax, Nr, rmax, Nm, dt )
+    # Check that the filter is not trivial
+    assert np.any( fld.spect[0].filter_array_z != 1. )
+
+    for m in range(Nm):
+        fld.interp[m].rho = random_complex_array( (Nz, Nr) )
+        fld.interp[m].Jr = random_complex_array( (Nz, Nr) )
+        fld.interp[m].Jt = random_complex_array( (Nz, Nr) )
+        fld.interp[m].Jz = random_complex_array( (Nz, Nr) )
+
+    for fieldtype, spect_fields in [ ('rho_prev', ['rho_prev']),
+                                     ('rho_next', ['rho_next']),
+                                     ('J', ['Jp', 'Jm', 'Jz']) ]:
+        # Unfiltered transform, followed by the filter
+        fld.interp2spect( fieldtype )
+        fld.filter_spect( fieldtype )
+        ref = [ getattr( fld.spect[m], field ).copy() \
+                    for m in range(Nm) for field in spect_fields ]
+        # Filtered transform
+        fld.interp2spect( fieldtype, filtered=True )
+        result = [ getattr( fld.spect[m], field ) \
+                    for m in range(Nm) for field in spect_fields ]
+        for array, array_ref in zip( result, ref ):
+            assert np.allclose( array, array_ref, rtol=1.e-14, atol=0 )
+
+if __name__ == '__main__' :
+
+    test_dht_filter_arrays()
+    test_filtered_interp2spect()
@@ -1,7 +1,7 @@
 # Copyright 2016, FBPIC contributors
 # Authors: Remi Lehe, Manuel Kirchen
 # License: 3-Clause-BSD-LBNL
-"""
+r"""
 This file tests the whole PIC-Cycle by simulating a
 linear, laser-driven plasma wakefield and comparing
 it to the analytical solution.
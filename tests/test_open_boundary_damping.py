@@ -0,0 +1,57 @@
+# Copyright 2020, FBPIC contributors
+# License: 3-Clause-BSD-LBNL
+"""
+This test file is part of FB-PIC (Fourier-Bessel Particle-In-Cell).
+
+It tests that `Simulation.exchange_and_damp_EB` damps the fields at the
+open boundaries in z, for a single-proc simulation without guard cells
+(`n_guard=0`). The fields are initialized to a smooth function, and
+after the call, the fields in the first and last cells of the box
+(where the damping array is 0) should be negligible.
+
+Usage :
+from the top-level directory of FBPIC run
+$ python tests/test_open_boundary_damping.py
+or
+$ py.test -q tests/test_open_boundary_damping.py
+"""
+import numpy as np
+from scipy.constants import c
+from fbpic.main import Simulation
+
+# Parameters of the simulation (open box, without particles)
+Nz = 200
+zmax = 20.e-6
+Nr = 16
+rmax = 10.e-6
+Nm = 2
+dt = zmax/Nz/c
+
+def test_damping_without_guard_cells():
+    "Function that is run by py.test, when doing `python setup.py test`"
+    sim = Simulation( Nz, zmax, Nr, rmax, Nm, dt, zmin=0., n_guard=0,
+                      n_damp={'z':32, 'r':0}, exchange_period=1,
+                      boundaries={'z':'open', 'r':'reflective'},
+                      use_cuda=False, verbose_level=0 )
+    sim.ptcl = []
+    assert sim.comm.n_guard == 0
+
+    # Initialize the fields to a smooth function of r
+    fld = sim.fld
+    r = fld.interp[0].r
+    for name in [ 'Er', 'Et', 'Ez', 'Br', 'Bt', 'Bz' ]:
+        getattr( fld.interp[0], name )[:,:] = np.exp( -r**2/rmax**2 )
+    fld.interp2spect('E')
+    fld.interp2spect('B')
+
+    sim.exchange_and_damp_EB()
+
+    # Check that the fields were damped at both ends of the box
+    for name in [ 'Er', 'Et', 'Ez', 'Br', 'Bt', 'Bz' ]:
+        field = getattr( fld.interp[0], name )
+        assert abs( field[0,:] ).max() < 1.e-3 * abs( field ).max()
+        assert abs( field[-1,:] ).max() < 1.e-3 * abs( field ).max()
+
+if __name__ == '__main__' :
+
+    test_damping_without_guard_cells()
@@ -1,7 +1,7 @@
 # Copyright 2016, FBPIC contributors
 # Authors: Remi Lehe, Manuel Kirchen
 # License: 3-Clause-BSD-LBNL
-"""
+r"""
 This test file is part of FB-PIC (Fourier-Bessel Particle-In-Cell).
 
 It tests the global PIC loop by launching a linear periodic plasma wave,
@@ -178,6 +178,35 @@ def test_periodic_plasma_wave_cubic_shape( show=False ):
     "Function that is run by py.test, when doing `python setup.py test"
     simulate_periodic_plasma_wave( 'cubic', show=show )
 
+def test_periodic_plasma_wave_correct_divE():
+    """
+    Function that is run by py.test, when doing `python setup.py test`
+
+    Check that a single call `sim.step(N)` with `correct_currents=False`
+    and `correct_divE=True` gives the same fields as N calls to
+    `sim.step(1)` (for which rho at t = (n+1) dt is always deposited,
+    since it is the last step of the call).
+    """
+    N = 5
+    fields = []
+    for n_calls, n_steps in [ (1, N), (N, 1) ]:
+        sim = Simulation( Nz, zmax, Nr, rmax, Nm, dt,
+                      p_zmin, p_zmax, p_rmin, p_rmax, p_nz, p_nr,
+                      p_nt, n_e, n_order=n_order, use_cuda=use_cuda )
+        impart_momenta( sim.ptcl[0], epsilons, k0, w0, wp )
+        for _ in range(n_calls):
+            sim.step( n_steps, correct_currents=False,
+                      correct_divE=True, show_progress=False )
+        fields.append( [ sim.fld.interp[m].Ez.copy() for m in range(Nm) ] )
+
+    # (The calls to `sim.step(1)` redeposit rho_prev and re-transform E
+    # and B, which leads to small differences ; when rho at t = (n+1) dt
+    # is not deposited, the fields instead differ by a few percent)
+    for m in range(Nm):
+        Ez_single, Ez_multi = fields[0][m], fields[1][m]
+        assert np.allclose( Ez_single, Ez_multi,
+                            atol=1.e-3*abs(Ez_multi).max() )
+
 def simulate_periodic_plasma_wave( particle_shape, show=False ):
     "Simulate a periodic plasma wave and check its fields"
 
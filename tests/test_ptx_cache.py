@@ -0,0 +1,106 @@
+# Copyright 2020, FBPIC contributors
+# License: 3-Clause-BSD-LBNL
+"""
+This test file is part of FB-PIC (Fourier-Bessel Particle-In-Cell).
+
+It tests the disk cache of the PTX code of the GPU kernels
+(see `compile_cupy` in fbpic/utils/cuda.py), i.e.:
+- that the hash of the source of a kernel changes when a device function
+  that it calls (and that is defined in another module) is modified
+- that the cached PTX code is found (cache hit) once it has been written,
+  and that missing or incomplete cache entries are ignored (cache miss)
+
+These checks do not require a GPU.
+
+Usage :
+from the top-level directory of FBPIC run
+$ python tests/test_ptx_cache.py
+or
+$ py.test -q tests/test_ptx_cache.py
+"""
+import os
+import sys
+import shutil
+import tempfile
+import importlib
+from fbpic.utils.cuda import get_kernel_source_hash, \
+    read_cached_ptx, write_cached_ptx
+
+# Source code of a module that defines a device function,
+# and of a module that defines a kernel which calls it
+helper_source = '''
+from numba import cuda
+
+@cuda.jit(device=True, inline=True)
+def shape_factor( x ):
+    return( %s )
+'''
+kernel_source = '''
+from numba import cuda
+from ptx_cache_helper import shape_factor
+
+def kernel( x ):
+    i = cuda.grid(1)
+    if i < x.shape[0]:
+        x[i] = shape_factor( x[i] )
+'''
+
+def test_kernel_source_hash():
+    "Function that is run by py.test, when doing `python setup.py test`"
+    temporary_dir = tempfile.mkdtemp()
+    sys.path.insert( 0, temporary_dir )
+    try:
+        helper_file = os.path.join( temporary_dir, 'ptx_cache_helper.py' )
+        with open( helper_file, 'w' ) as f:
+            f.write( helper_source %'1. - x' )
+        with open( os.path.join(temporary_dir, 'ptx_cache_kernel.py'),
+                   'w' ) as f:
+            f.write( kernel_source )
+        kernel = importlib.import_module( 'ptx_cache_kernel' ).kernel
+
+        # The hash does not change as long as the sources do not change
+        hash_1 = get_kernel_source_hash( kernel )
+        assert hash_1 is not None
+        assert get_kernel_source_hash( kernel ) == hash_1
+
+        # Modify the device function: the hash of the kernel changes
+        with open( helper_file, 'w' ) as f:
+            f.write( helper_source %'1. + x' )
+        hash_2 = get_kernel_source_hash( kernel )
+        assert hash_2 is not None
+        assert hash_2 != hash_1
+    finally:
+        sys.path.remove( temporary_dir )
+        for module_name in [ 'ptx_cache_helper', 'ptx_cache_kernel' ]:
+            sys.modules.pop( module_name, None )
+        shutil.rmtree( temporary_dir )
+
+def test_ptx_cache_hit_and_miss():
+    "Function that is run by py.test, when doing `python setup.py test`"
+    temporary_dir = tempfile.mkdtemp()
+    try:
+        # The cache directory is created when writing the first entry
+        ptx_file = os.path.join( temporary_dir, 'cache', 'kernel.ptx' )
+        ptx = b'// PTX code of the kernel'
+
+        # Cache miss: no entry yet
+        assert read_cached_ptx( ptx_file ) is None
+
+        # Cache hit: the entry that was written is read back
+        write_cached_ptx( ptx_file, ptx, 'kernel_name' )
+        assert read_cached_ptx( ptx_file ) == ( ptx, 'kernel_name' )
+
+        # Cache miss: incomplete or corrupted entries are ignored
+        name_file = ptx_file[:-4] + '.json'
+        with open( name_file, 'w' ) as f:
+            f.write( '{"entry_' )
+        assert read_cached_ptx( ptx_file ) is None
+        os.remove( name_file )
+        assert read_cached_ptx( ptx_file ) is None
+    finally:
+        shutil.rmtree( temporary_dir )
+
+if __name__ == '__main__' :
+
+    test_kernel_source_hash()
+    test_ptx_cache_hit_and_miss()